@@ -1,12 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date, timedelta
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
 import calendar
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
+# Snapshots of the locale-aware calendar proxies, which format on every lookup.
+_MONTH_NAME = tuple(calendar.month_name)
+_MONTH_ABBR = tuple(calendar.month_abbr)
+_DAY_ABBR = tuple(calendar.day_abbr)
+_MAX_ORD = date.max.toordinal()
 
-@dataclass(frozen=True)
+
+def _iso_weeks_in_year(jan1_weekday: int, leap: bool) -> int:
+    """Return 53 for years starting on a Thursday (or a Wednesday in leap years), else 52."""
+    return 53 if jan1_weekday == 3 or (leap and jan1_weekday == 2) else 52
+
+
+@dataclass(frozen=True, slots=True)
 class MonthInfo:
     index: int
     name: str
@@ -15,66 +28,156 @@ class MonthInfo:
     start_day_of_year: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CalendarModel:
     year: int
-    months: List[MonthInfo]
+    months: Tuple[MonthInfo, ...]
     total_days: int
     weeks_in_year: int
 
+    def __post_init__(self) -> None:
+        # First-of-month ordinals (plus next Jan 1) let week math work on plain
+        # integers instead of stepping through date objects.
+        year_start_ord = date(self.year, 1, 1).toordinal()
+        object.__setattr__(self, "_year_start_ord", year_start_ord)
+        # ISO week 1 is the week containing January 4th
+        jan4_ord = year_start_ord + 3
+        object.__setattr__(self, "_week1_monday_ord", jan4_ord - (jan4_ord - 1) % 7)
+        # Parallel per-month columns for the per-day accessors, which would
+        # otherwise go through a MonthInfo attribute lookup on every call
+        object.__setattr__(self, "_month_start_doys", tuple(m.start_day_of_year for m in self.months))
+        object.__setattr__(self, "_month_days", tuple(m.days for m in self.months))
+        object.__setattr__(
+            self,
+            "_month_start_ords",
+            tuple(year_start_ord + m.start_day_of_year for m in self.months) + (year_start_ord + self.total_days,),
+        )
+
+        # Per-day weekday (Mon=0) and ISO week tables, filled once so the
+        # daily page accessors never construct date objects.
+        day_ords = range(self._year_start_ord, self._year_start_ord + self.total_days)
+        object.__setattr__(self, "_weekdays", tuple((o - 1) % 7 for o in day_ords))
+        # ISO week = whole weeks since week 1's Monday. Days before it (at most
+        # Jan 1-3) close the previous ISO year; days past the last week open
+        # the next year's week 1.
+        week1_monday_ord = self._week1_monday_ord
+        prev_jan1_weekday = (year_start_ord - (365 + calendar.isleap(self.year - 1)) - 1) % 7
+        prev_year_weeks = _iso_weeks_in_year(prev_jan1_weekday, calendar.isleap(self.year - 1))
+        iso_weeks = []
+        for o in day_ords:
+            week_num = (o - week1_monday_ord) // 7 + 1
+            if week_num < 1:
+                week_num = prev_year_weeks
+            elif week_num > self.weeks_in_year:
+                week_num = 1
+            iso_weeks.append(week_num)
+        object.__setattr__(self, "_iso_weeks", tuple(iso_weeks))
+        object.__setattr__(
+            self, "_date_labels", tuple(f"{m.abbrev} {day}" for m in self.months for day in range(1, m.days + 1))
+        )
+        object.__setattr__(
+            self,
+            "_day_headings",
+            tuple(f"{_DAY_ABBR[weekday]}, {label}" for weekday, label in zip(self._weekdays, self._date_labels)),
+        )
+
+        # (Monday, Sunday) pairs and their labels for weeks 0..weeks_in_year+1,
+        # covering the partial weeks that straddle either year boundary. Weeks
+        # reaching past date.min/date.max (years 1 and 9999) are left as None
+        # and raise from the lazy path on lookup, as before.
+        week_ranges = tuple(
+            self._compute_week_date_range(week_num)
+            if 1 <= week1_monday_ord + 7 * (week_num - 1) <= _MAX_ORD - 6
+            else None
+            for week_num in range(self.weeks_in_year + 2)
+        )
+        object.__setattr__(self, "_week_ranges", week_ranges)
+        object.__setattr__(
+            self,
+            "_week_range_labels",
+            tuple(week_range and self._format_week_date_range(*week_range) for week_range in week_ranges),
+        )
+
+        # Week/month groupings are queried repeatedly while rendering, so they
+        # are resolved once here instead of on every call.
+        primary_months = (-1,) + tuple(
+            self._compute_week_primary_month(week_num) for week_num in range(1, self.weeks_in_year + 1)
+        )
+        weeks_by_month: List[List[int]] = [[] for _ in range(12)]
+        for week_num in range(1, self.weeks_in_year + 1):
+            weeks_by_month[primary_months[week_num]].append(week_num)
+
+        object.__setattr__(self, "_week_primary_months", primary_months)
+        object.__setattr__(self, "_week_starts", self._compute_week_starts())
+        object.__setattr__(self, "_weeks_by_month", tuple(tuple(weeks) for weeks in weeks_by_month))
+
+    _year_start_ord: int = field(init=False, repr=False, compare=False)
+    _week1_monday_ord: int = field(init=False, repr=False, compare=False)
+    _month_start_doys: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _month_days: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _month_start_ords: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _weekdays: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _iso_weeks: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _date_labels: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _day_headings: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _week_ranges: Tuple[Optional[Tuple[date, date]], ...] = field(init=False, repr=False, compare=False)
+    _week_range_labels: Tuple[Optional[str], ...] = field(init=False, repr=False, compare=False)
+    _week_primary_months: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _week_starts: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _weeks_by_month: Tuple[Tuple[int, ...], ...] = field(init=False, repr=False, compare=False)
+
     @classmethod
     def for_year(cls, year: int) -> "CalendarModel":
-        months: List[MonthInfo] = []
-        day_cursor = 0
-        for month in range(1, 13):
-            days = calendar.monthrange(year, month)[1]
-            info = MonthInfo(
-                index=month - 1,
-                name=calendar.month_name[month],
-                abbrev=calendar.month_abbr[month],
-                days=days,
-                start_day_of_year=day_cursor,
-            )
-            months.append(info)
-            day_cursor += days
-
-        weeks_in_year = date(year, 12, 28).isocalendar().week
-        return cls(year=year, months=months, total_days=day_cursor, weeks_in_year=weeks_in_year)
+        # Models are immutable, so one instance per year is shared
+        return _build_for_year(cls, year)
 
     def month(self, month_idx: int) -> MonthInfo:
         return self.months[month_idx]
 
     def day_of_year(self, month_idx: int, day: int) -> int:
-        return self.months[month_idx].start_day_of_year + (day - 1)
+        return self._month_start_doys[month_idx] + (day - 1)
 
     def date_label(self, month_idx: int, day: int) -> str:
-        return f"{self.months[month_idx].abbrev} {day}"
+        return self._date_labels[self._month_start_doys[month_idx] + day - 1]
+
+    def day_heading(self, month_idx: int, day: int) -> str:
+        """Return the daily page heading with the weekday (e.g., 'Mon, Jan 15')."""
+        return self._day_headings[self._month_start_doys[month_idx] + day - 1]
 
     def week_of_date(self, month_idx: int, day: int) -> int:
         """Return the ISO week number (1-based) for a given month and day."""
-        d = date(self.year, month_idx + 1, day)
-        return d.isocalendar().week
+        return self._iso_weeks[self._month_start_doys[month_idx] + day - 1]
 
     def week_date_range(self, week_num: int) -> Tuple[date, date]:
         """Return (Monday, Sunday) dates for the given ISO week number."""
+        if 0 <= week_num < len(self._week_ranges):
+            week_range = self._week_ranges[week_num]
+            if week_range is not None:
+                return week_range
+        return self._compute_week_date_range(week_num)
+
+    def _compute_week_date_range(self, week_num: int) -> Tuple[date, date]:
         # ISO week: Week 1 contains January 4th
-        jan4 = date(self.year, 1, 4)
-        week1_monday = jan4 - timedelta(days=jan4.weekday())
-        start = week1_monday + timedelta(weeks=week_num - 1)
-        end = start + timedelta(days=6)
-        return start, end
+        start_ord = self._week1_monday_ord + 7 * (week_num - 1)
+        return date.fromordinal(start_ord), date.fromordinal(start_ord + 6)
 
     def week_date_range_label(self, week_num: int) -> str:
         """Return formatted date range label for the given ISO week (e.g., 'Dec 29 - Jan 4')."""
-        start, end = self.week_date_range(week_num)
-        start_label = f"{calendar.month_abbr[start.month]} {start.day}"
-        end_label = f"{calendar.month_abbr[end.month]} {end.day}"
+        if 0 <= week_num < len(self._week_range_labels):
+            label = self._week_range_labels[week_num]
+            if label is not None:
+                return label
+        return self._format_week_date_range(*self._compute_week_date_range(week_num))
+
+    @staticmethod
+    def _format_week_date_range(start: date, end: date) -> str:
+        start_label = f"{_MONTH_ABBR[start.month]} {start.day}"
+        end_label = f"{_MONTH_ABBR[end.month]} {end.day}"
         return f"{start_label} - {end_label}"
 
     def day_of_week_abbrev(self, month_idx: int, day: int) -> str:
         """Return abbreviated day name (Mon, Tue, etc.)."""
-        d = date(self.year, month_idx + 1, day)
-        return calendar.day_abbr[d.weekday()]
+        return _DAY_ABBR[self._weekdays[self._month_start_doys[month_idx] + day - 1]]
 
     def compute_week_starts(self) -> List[int]:
         """Return list of first ISO week number for each month (0-indexed month).
@@ -83,49 +186,48 @@ class CalendarModel:
         of the previous year, and week 52/53 may extend into January of
         the next year.
         """
+        # A fresh list each call, so callers cannot change the shared model
+        return list(self._week_starts)
+
+    def _compute_week_starts(self) -> Tuple[int, ...]:
         result = []
-        for month_idx in range(12):
-            first_day = date(self.year, month_idx + 1, 1)
-            iso_year, week_num, _ = first_day.isocalendar()
-            # If ISO year differs from calendar year, find the first week
-            # that actually belongs to this year
-            if iso_year < self.year:
-                # First day of Jan is in last week of previous year
-                # Find first Monday of this year
-                for d in range(1, 8):
-                    test_date = date(self.year, 1, d)
-                    if test_date.isocalendar().year == self.year:
-                        week_num = test_date.isocalendar().week
-                        break
+        for month in self.months:
+            week_num = self._iso_weeks[month.start_day_of_year]
+            # Only Jan 1 can fall in the previous ISO year (week 52/53). The
+            # year's first Monday, Jan 1 + (7 - weekday) % 7, then opens week 1.
+            if month.index == 0 and week_num > 1:
+                week_num = 1
             result.append(week_num)
-        return result
+        return tuple(result)
 
     def week_primary_month(self, week_num: int) -> int:
         """Return the month index (0-based) where most days of this week fall.
 
         For a week spanning two months, returns the month with 4+ days.
         """
-        start_date, end_date = self.week_date_range(week_num)
-
-        # Count days in each month
-        days_per_month: dict[int, int] = {}
-        current = start_date
-        while current <= end_date:
-            # Only count days within this year
-            if current.year == self.year:
-                month_idx = current.month - 1
-                days_per_month[month_idx] = days_per_month.get(month_idx, 0) + 1
-            current += timedelta(days=1)
-
-        if not days_per_month:
+        if 1 <= week_num <= self.weeks_in_year:
+            return self._week_primary_months[week_num]
+        return self._compute_week_primary_month(week_num)
+
+    def _compute_week_primary_month(self, week_num: int) -> int:
+        start_ord = self._week1_monday_ord + 7 * (week_num - 1)
+        month_start_ords = self._month_start_ords
+        year_start_ord = month_start_ords[0]
+
+        # Only count days within this year
+        first_ord = max(start_ord, year_start_ord)
+        end_ord = min(start_ord + 7, month_start_ords[12])
+        if first_ord >= end_ord:
             # All days are outside this year, default to January or December
-            if start_date.year < self.year:
-                return 0  # January
-            else:
-                return 11  # December
+            return 0 if start_ord < year_start_ord else 11
 
-        # Return month with most days
-        return max(days_per_month, key=lambda m: days_per_month[m])
+        # A week spans at most two months: split it at the next month boundary
+        month_idx = bisect_right(month_start_ords, first_ord) - 1
+        days_first = min(month_start_ords[month_idx + 1], end_ord) - first_ord
+        days_second = end_ord - first_ord - days_first
+
+        # The second month wins only if it holds more of the week's days
+        return month_idx + (days_second > days_first)
 
     def compute_weeks_by_month(self) -> List[List[int]]:
         """Return list of week numbers for each month, based on majority days.
@@ -133,17 +235,33 @@ class CalendarModel:
         Returns a list of 12 lists, where each inner list contains the week
         numbers that primarily belong to that month.
         """
-        result: List[List[int]] = [[] for _ in range(12)]
-        for week_num in range(1, self.weeks_in_year + 1):
-            month_idx = self.week_primary_month(week_num)
-            result[month_idx].append(week_num)
-        return result
+        # Fresh lists each call, so callers cannot change the shared model
+        return [list(weeks) for weeks in self._weeks_by_month]
 
     def is_last_day_of_month(self, month_idx: int, day: int) -> bool:
         """Return True if this is the last day of the month."""
-        return day == self.months[month_idx].days
+        return day == self._month_days[month_idx]
 
     def is_last_day_of_week(self, month_idx: int, day: int) -> bool:
         """Return True if this is Sunday (last day of ISO week)."""
-        d = date(self.year, month_idx + 1, day)
-        return d.weekday() == 6  # Sunday = 6
+        return self._weekdays[self._month_start_doys[month_idx] + day - 1] == 6  # Sunday = 6
+
+
+@lru_cache(maxsize=8)
+def _build_for_year(cls: type, year: int) -> CalendarModel:
+    months = []
+    day_cursor = 0
+    for month in range(1, 13):
+        days = calendar.monthrange(year, month)[1]
+        info = MonthInfo(
+            index=month - 1,
+            name=_MONTH_NAME[month],
+            abbrev=_MONTH_ABBR[month],
+            days=days,
+            start_day_of_year=day_cursor,
+        )
+        months.append(info)
+        day_cursor += days
+
+    weeks_in_year = date(year, 12, 28).isocalendar().week
+    return cls(year=year, months=tuple(months), total_days=day_cursor, weeks_in_year=weeks_in_year)
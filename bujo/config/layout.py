@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Layout:
     target_width: int = 954
     target_height: int = 1696
@@ -19,6 +19,31 @@ class Layout:
         object.__setattr__(self, "content_bottom", self.target_height - self.margin_bottom)
         object.__setattr__(self, "content_width", self.content_right - self.content_left)
         object.__setattr__(self, "content_height", self.content_bottom - self.content_top)
+        # Shared page furniture: nav link row, page title, and the standard
+        # dot grid band that ends just above the footer
+        object.__setattr__(self, "nav_y", self.content_top + 5)
+        object.__setattr__(self, "title_y", self.content_top + 50)
+        object.__setattr__(self, "grid_top", self.content_top + 115)
+        object.__setattr__(self, "grid_bottom", self.target_height - 70)
+        # Guide pages start their grid right under the smaller header title;
+        # daily pages put the date heading below the breadcrumb row
+        object.__setattr__(self, "guide_grid_top", self.content_top + 100)
+        object.__setattr__(self, "day_title_y", self.content_top + 70)
+        object.__setattr__(self, "day_grid_top", self.content_top + 145)
+        # Footer divider, placed from the page bottom rather than content_bottom
+        object.__setattr__(self, "footer_y", self.target_height - 55)
+        # Index pages: first row of Index A, and the body under the Index B
+        # and collection index headings (also the guide card row)
+        object.__setattr__(self, "index_rows_top", self.content_top + 80)
+        object.__setattr__(self, "section_top", self.content_top + 130)
+        object.__setattr__(self, "setup_cards_top", self.content_top + 120)
+        # Weekly pages: baseline of the clickable date range beside the title
+        object.__setattr__(self, "week_range_y", self.content_top + 55)
+        # Pages without a footer: daily continuation grid runs further down;
+        # collection pages have only the nav row above their grid
+        object.__setattr__(self, "continuation_grid_bottom", self.target_height - 50)
+        object.__setattr__(self, "collection_grid_top", self.content_top + 50)
+        object.__setattr__(self, "collection_grid_bottom", self.content_bottom - 30)
 
     content_left: int = field(init=False)
     content_right: int = field(init=False)
@@ -26,3 +51,18 @@ class Layout:
     content_bottom: int = field(init=False)
     content_width: int = field(init=False)
     content_height: int = field(init=False)
+    nav_y: int = field(init=False)
+    title_y: int = field(init=False)
+    grid_top: int = field(init=False)
+    grid_bottom: int = field(init=False)
+    guide_grid_top: int = field(init=False)
+    day_title_y: int = field(init=False)
+    day_grid_top: int = field(init=False)
+    footer_y: int = field(init=False)
+    index_rows_top: int = field(init=False)
+    section_top: int = field(init=False)
+    setup_cards_top: int = field(init=False)
+    week_range_y: int = field(init=False)
+    continuation_grid_bottom: int = field(init=False)
+    collection_grid_top: int = field(init=False)
+    collection_grid_bottom: int = field(init=False)
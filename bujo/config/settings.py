@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     year: int = 2026
     pages_per_day: int = 1
@@ -13,3 +13,8 @@ class Settings:
     num_collection_indexes: int = 2
 
     output_path: str = "output/BulletJournal_rPPM.pdf"
+
+    def __post_init__(self) -> None:
+        # Daily pages are laid out pages_per_day apart, so every day needs a page
+        if self.pages_per_day < 1:
+            raise ValueError(f"pages_per_day must be at least 1, got {self.pages_per_day}")
@@ -1,8 +1,23 @@
 from dataclasses import dataclass, field
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
+# Shared read-only default; every Typography() references the same mapping
+_DEFAULT_SIZES: Mapping[str, int] = MappingProxyType({
+    "title_cover": 48,
+    "title_page": 52,
+    "header": 32,
+    "subheader": 28,
+    "body": 32,
+    "nav": 24,
+    "footer": 22,
+    "small": 24,
+    "tiny": 20,
+    "day_number": 26,
+})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Typography:
     font_path_regular: str = "fonts/EBGaramond-Regular.ttf"
     font_path_italic: str = "fonts/EBGaramond-Italic.ttf"
@@ -11,18 +26,9 @@ class Typography:
     fallback_regular: str = "helv"
     fallback_italic: str = "helvI"
 
-    sizes: Dict[str, int] = field(default_factory=lambda: {
-        "title_cover": 48,
-        "title_page": 52,
-        "header": 32,
-        "subheader": 28,
-        "body": 32,
-        "nav": 24,
-        "footer": 22,
-        "small": 24,
-        "tiny": 20,
-        "day_number": 26,
-    })
+    # A mappingproxy default is rejected as mutable before Python 3.12,
+    # so the factory hands back the shared singleton instead.
+    sizes: Mapping[str, int] = field(default_factory=lambda: _DEFAULT_SIZES)
 
     arrow_size_large: int = 14
     arrow_size_small: int = 10
@@ -70,40 +70,74 @@ class BulletJournalGenerator:
             typography=self.typography,
         )
 
-        generate_cover(ctx, page_map.cover)
-        generate_main_index(ctx, page_map.main_index)
-        generate_year_index(ctx, page_map.year_index)
-
-        generate_collection_index(ctx, page_map.collection_index_c, "C")
-        generate_collection_index(ctx, page_map.collection_index_d, "D")
-
-        generate_guide_symbol_reference(ctx, page_map.guide_start)
-        generate_guide_system(ctx, page_map.guide_start + 1)
-        generate_guide_practice(ctx, page_map.guide_start + 2)
-        generate_guide_set_up_logs(ctx, page_map.guide_start + 3)
-        generate_guide_intention(ctx, page_map.guide_start + 4)
-        generate_guide_goals(ctx, page_map.guide_start + 5)
-
-        for quarter in range(self.settings.num_future_log_pages):
-            generate_future_log(ctx, page_map.future_log_start + quarter, quarter + 1)
+        # Front matter, one page per generator; each page's text is queued and
+        # written as one text object per color
+        front_pages = [
+            (generate_cover, page_map.cover, ()),
+            (generate_main_index, page_map.main_index, ()),
+            (generate_year_index, page_map.year_index, ()),
+            (generate_collection_index, page_map.collection_index_c, ("C",)),
+            (generate_collection_index, page_map.collection_index_d, ("D",)),
+            (generate_guide_symbol_reference, page_map.guide_start, ()),
+            (generate_guide_system, page_map.guide_start + 1, ()),
+            (generate_guide_practice, page_map.guide_start + 2, ()),
+            (generate_guide_set_up_logs, page_map.guide_start + 3, ()),
+            (generate_guide_intention, page_map.guide_start + 4, ()),
+            (generate_guide_goals, page_map.guide_start + 5, ()),
+        ]
+        front_pages.extend(
+            (generate_future_log, page_map.future_log_start + quarter, (quarter + 1,))
+            for quarter in range(self.settings.num_future_log_pages)
+        )
+        for generate_page, page_idx, args in front_pages:
+            with renderer.batch(page_idx):
+                generate_page(ctx, page_idx, *args)
 
+        # The repeated page kinds queue their text and write it once per page
         for month_idx in range(12):
-            generate_monthly_timeline(ctx, page_map.month_timeline(month_idx), month_idx)
-            generate_monthly_action_plan(ctx, page_map.month_action_plan(month_idx), month_idx)
+            page_idx = page_map.month_timeline(month_idx)
+            with renderer.batch(page_idx):
+                generate_monthly_timeline(ctx, page_idx, month_idx)
+            page_idx = page_map.month_action_plan(month_idx)
+            with renderer.batch(page_idx):
+                generate_monthly_action_plan(ctx, page_idx, month_idx)
 
         for week_idx in range(calendar.weeks_in_year):
-            generate_weekly_action_plan(ctx, page_map.weekly_action(week_idx), week_idx)
-            generate_weekly_reflection(ctx, page_map.weekly_reflection(week_idx), week_idx)
-
+            page_idx = page_map.weekly_action(week_idx)
+            with renderer.batch(page_idx):
+                generate_weekly_action_plan(ctx, page_idx, week_idx)
+            page_idx = page_map.weekly_reflection(week_idx)
+            with renderer.batch(page_idx):
+                generate_weekly_reflection(ctx, page_idx, week_idx)
+
+        # Flat (page_idx, month_idx, day) schedules, split by page kind so the
+        # emit loops below carry no per-page branching
+        daily_pages: list[tuple[int, int, int]] = []
         for month in calendar.months:
-            for day in range(1, month.days + 1):
-                day_of_year = calendar.day_of_year(month.index, day)
-                for page_in_day in range(self.settings.pages_per_day):
-                    page_idx = page_map.daily_page(day_of_year, page_in_day)
-                    if page_in_day == 0:
-                        generate_daily_log(ctx, page_idx, month.index, day)
-                    else:
-                        generate_daily_log_continuation(ctx, page_idx, month.index, day)
+            first_day = month.start_day_of_year
+            month_pages = page_map.daily_pages(first_day, first_day + month.days)
+            daily_pages.extend((page_idx, month.index, day) for day, page_idx in enumerate(month_pages, 1))
+
+        # Continuation pages directly follow their day's first page; branch once
+        # on the layout so the common 1- and 2-page cases need no inner loop
+        pages_per_day = self.settings.pages_per_day
+        if pages_per_day == 1:
+            continuation_pages: list[tuple[int, int, int]] = []
+        elif pages_per_day == 2:
+            continuation_pages = [(page_idx + 1, month_idx, day) for page_idx, month_idx, day in daily_pages]
+        else:
+            continuation_pages = [
+                (page_idx + page_in_day, month_idx, day)
+                for page_idx, month_idx, day in daily_pages
+                for page_in_day in range(1, pages_per_day)
+            ]
+
+        for page_idx, month_idx, day in daily_pages:
+            with renderer.batch(page_idx):
+                generate_daily_log(ctx, page_idx, month_idx, day)
+        for page_idx, month_idx, day in continuation_pages:
+            with renderer.batch(page_idx):
+                generate_daily_log_continuation(ctx, page_idx, month_idx, day)
 
         total_collections = self.settings.num_collections_per_index * self.settings.num_collection_indexes
         for collection_idx in range(total_collections):
@@ -113,7 +147,8 @@ class BulletJournalGenerator:
                 else page_map.collection_index_d
             )
             page_idx = page_map.collection_page(collection_idx)
-            generate_collection_page(ctx, page_idx, index_page)
+            with renderer.batch(page_idx):
+                generate_collection_page(ctx, page_idx, index_page)
 
         invalid_links = links.apply(doc)
         report = ValidationReport(
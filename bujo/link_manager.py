@@ -1,10 +1,29 @@
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 import fitz
 
 
-@dataclass
+def _pdf_number(value: float) -> str:
+    # Number format for every raw PDF operator and dictionary the package writes
+    return f"{value:.4f}".rstrip("0").rstrip(".")
+
+
+def _append_annots(doc: fitz.Document, page_xref: int, refs: List[str]) -> None:
+    """Add annotation object references to the end of a page's /Annots array."""
+    kind, annots = doc.xref_get_key(page_xref, "Annots")
+    if kind == "xref":
+        annots = doc.xref_object(int(annots.split()[0]), compressed=True)
+        kind = "array"
+    if kind == "array":
+        annots = f"{annots[:-1]} {' '.join(refs)}]"
+    else:
+        annots = f"[{' '.join(refs)}]"
+    doc.xref_set_key(page_xref, "Annots", annots)
+
+
+@dataclass(slots=True)
 class DeferredLink:
     page_idx: int
     rect: Tuple[float, float, float, float]
@@ -13,26 +32,100 @@ class DeferredLink:
 
 class LinkManager:
     def __init__(self) -> None:
-        self._links: List[DeferredLink] = []
+        # Column-wise storage: DeferredLink objects are only built on demand
+        self._page_idx: List[int] = []
+        self._rects: List[Tuple[float, float, float, float]] = []
+        self._dest_page_idx: List[int] = []
 
     @property
     def links(self) -> List[DeferredLink]:
-        return self._links
+        """Return a snapshot of the queued links, built fresh on each access.
+
+        Links are stored column-wise, so mutating the returned list or its
+        items does not change what ``apply`` inserts; use ``add`` instead.
+        """
+        return [self._link_at(i) for i in range(len(self._page_idx))]
 
     def add(self, page_idx: int, rect: Tuple[float, float, float, float], dest_page_idx: int) -> None:
-        self._links.append(DeferredLink(page_idx=page_idx, rect=rect, dest_page_idx=dest_page_idx))
+        self._page_idx.append(page_idx)
+        self._rects.append(rect)
+        self._dest_page_idx.append(dest_page_idx)
+
+    def add_many(
+        self,
+        page_idx: int,
+        rects: Sequence[Tuple[float, float, float, float]],
+        dest_page_idxs: Sequence[int],
+    ) -> None:
+        """Add one link per (rect, destination) pair, all on the same source page."""
+        if len(rects) != len(dest_page_idxs):
+            raise ValueError("rects and dest_page_idxs must have the same length")
+        self._page_idx.extend([page_idx] * len(rects))
+        self._rects.extend(rects)
+        self._dest_page_idx.extend(dest_page_idxs)
+
+    def _link_at(self, i: int) -> DeferredLink:
+        return DeferredLink(self._page_idx[i], self._rects[i], self._dest_page_idx[i])
 
     def apply(self, doc: fitz.Document) -> List[DeferredLink]:
         invalid: List[DeferredLink] = []
         total_pages = len(doc)
-        for link in self._links:
-            if 0 <= link.dest_page_idx < total_pages:
-                page = doc[link.page_idx]
-                page.insert_link({
-                    "kind": fitz.LINK_GOTO,
-                    "page": link.dest_page_idx,
-                    "from": fitz.Rect(link.rect),
-                })
+        rects = self._rects
+        dest_page_idx = self._dest_page_idx
+
+        # Group by source page so each page is resolved once, not once per link
+        by_page: Dict[int, List[int]] = defaultdict(list)
+        for i, (page_idx, dest) in enumerate(zip(self._page_idx, dest_page_idx)):
+            if 0 <= dest < total_pages:
+                by_page[page_idx].append(i)
             else:
-                invalid.append(link)
+                invalid.append(self._link_at(i))
+
+        # Link annotations are written out as Page.insert_link would write them
+        # and listed in each source page's /Annots with one update; insert_link
+        # instead loads the destination page and rescans the source page's
+        # annotations for every link
+        stem = fitz.TOOLS.set_annot_stem()
+        goto_targets: Dict[int, str] = {}
+        # Navigation links reuse the same few rects on every page, so each
+        # distinct rect is transformed and formatted once per page geometry
+        rect_strings: Dict[Tuple[Tuple[float, ...], Tuple[float, float, float, float]], str] = {}
+        # Most destinations also carry links, so each page is loaded (and its
+        # matrix inverted) once whether it is reached as source or destination
+        loaded: Dict[int, Tuple[fitz.Page, fitz.Matrix]] = {}
+
+        def load(idx: int) -> Tuple[fitz.Page, fitz.Matrix]:
+            entry = loaded.get(idx)
+            if entry is None:
+                page = doc[idx]
+                entry = loaded[idx] = (page, ~page.transformation_matrix)
+            return entry
+
+        for page_idx, indices in by_page.items():
+            page, ictm = load(page_idx)
+            geometry = tuple(ictm)
+            taken = {name for _, kind, name in page.annot_xrefs() if kind == fitz.PDF_ANNOT_LINK}
+            refs = []
+            n = 0
+            for i in indices:
+                dest = dest_page_idx[i]
+                target = goto_targets.get(dest)
+                if target is None:
+                    # Links jump to the destination page's top-left corner
+                    top_left = fitz.Point(0, 0) * load(dest)[1]
+                    target = goto_targets[dest] = (
+                        f"{doc.page_xref(dest)} 0 R/XYZ {_pdf_number(top_left.x)} {_pdf_number(top_left.y)} 0"
+                    )
+                while f"{stem}-L{n}" in taken:
+                    n += 1
+                name = f"{stem}-L{n}"
+                n += 1
+                key = (geometry, rects[i])
+                rect = rect_strings.get(key)
+                if rect is None:
+                    rect = rect_strings[key] = " ".join(_pdf_number(v) for v in fitz.Rect(rects[i]) * ictm)
+                xref = doc.get_new_xref()
+                doc.update_object(xref, f"<</A<</S/GoTo/D[{target}]>>/Rect[{rect}]/BS<</W 0>>/Subtype/Link/NM({name})>>")
+                refs.append(f"{xref} 0 R")
+            _append_annots(doc, page.xref, refs)
         return invalid
@@ -7,7 +7,7 @@ from .calendar_model import CalendarModel
 from .config import Settings
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageMap:
     cover: int
     main_index: int
@@ -42,11 +42,16 @@ class PageMap:
     def daily_page(self, day_of_year: int, page_in_day: int = 0) -> int:
         return self.daily_start + day_of_year * self.pages_per_day + page_in_day
 
+    def daily_pages(self, start_day: int, end_day: int) -> range:
+        """Return the first page of each day in [start_day, end_day), indexable by day offset."""
+        step = self.pages_per_day
+        return range(self.daily_start + start_day * step, self.daily_start + end_day * step, step)
+
     def collection_page(self, collection_idx: int) -> int:
         return self.collection_start + collection_idx * self.pages_per_collection
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageCounts:
     guide_pages: int
     future_log_pages: int
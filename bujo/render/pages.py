@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
+from types import MappingProxyType
+from typing import Mapping
 import fitz
 
 from bujo.calendar_model import CalendarModel
 from bujo.config import Layout, Settings, Theme, Typography
 from bujo.page_map import PageMap
-from .primitives import Renderer
+from .primitives import Renderer, StrokeBatch, add_line_segments
 
 
-FOOTER_TEXTS = {
+# Read-only: the texts are shared by every generator and never change at runtime
+FOOTER_TEXTS: Mapping[str, str] = MappingProxyType({
     "daily_log": "Rapid log your thoughts as they bubble up.",
     "daily_log_week_end": "End of week: time to reflect and migrate.",
     "daily_log_month_end": "End of month: review, reflect, and plan ahead.",
@@ -21,10 +25,10 @@ FOOTER_TEXTS = {
     "monthly_action": "Organize and prioritize your monthly tasks.",
     "intention": "Intention is a commitment to a process. It guides your choices in the present moment.",
     "goals": "Goals define outcomes. They transform desires into tangible destinations.",
-}
+})
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageContext:
     renderer: Renderer
     calendar: CalendarModel
@@ -141,7 +145,7 @@ def _draw_cover_flow_field(page, layout, theme) -> None:
 
 
 def generate_cover(ctx: PageContext, page_idx: int) -> None:
-    page = ctx.renderer.doc[page_idx]
+    page = ctx.renderer.page(page_idx)
     page.draw_rect(page.rect, color=ctx.theme.black, fill=ctx.theme.black)
 
     # Draw flow field pattern first (behind text)
@@ -168,53 +172,66 @@ def generate_cover(ctx: PageContext, page_idx: int) -> None:
     ctx.renderer.add_text(page, str(ctx.settings.year), text_x, year_y, year_size, ctx.theme.white)
 
 
+def _week_cell_layout(
+    week_col_start: float, week_cell_width: float, content_widths: list[float]
+) -> list[tuple[float, float]]:
+    """Return (cell left, centred content x) for consecutive week cells of the given content widths."""
+    cells = []
+    for i, content_width in enumerate(content_widths):
+        cell_start = week_col_start + i * week_cell_width
+        cells.append((cell_start, cell_start + (week_cell_width - content_width) / 2))
+    return cells
+
+
+# Main index rows for the guide pages, in page order from guide_start
+_GUIDE_TITLES = ("Symbol Reference", "The System", "The Practice", "Set up your logs", "Intention", "Goals")
+
+
 def generate_main_index(ctx: PageContext, page_idx: int) -> None:
-    page = ctx.renderer.doc[page_idx]
+    page = ctx.renderer.page(page_idx)
+    # All strokes on the page are batched into one shape, committed at the end;
+    # the identical 0.5pt row rules are collected and emitted as one path
+    shape = page.new_shape()
+    rules: list[tuple[float, float, float, float]] = []
 
-    ctx.renderer.add_text(page, "Index A", ctx.layout.content_left, ctx.layout.content_top + 10, ctx.typography.sizes["title_page"])
+    content_left = ctx.layout.content_left
+    content_right = ctx.layout.content_right
+    line_color = ctx.theme.line
+    body_size = ctx.typography.sizes["body"]
+    small_size = ctx.typography.sizes["small"]
+    arrow_small = ctx.typography.arrow_size_small
 
-    y = ctx.layout.content_top + 80
-    row_height = 52
+    ctx.renderer.add_text(page, "Index A", content_left, ctx.layout.content_top + 10, ctx.typography.sizes["title_page"])
 
-    guide_links = [
-        ("Symbol Reference", ctx.page_map.guide_start),
-        ("The System", ctx.page_map.guide_start + 1),
-        ("The Practice", ctx.page_map.guide_start + 2),
-        ("Set up your logs", ctx.page_map.guide_start + 3),
-        ("Intention", ctx.page_map.guide_start + 4),
-        ("Goals", ctx.page_map.guide_start + 5),
-        ("Future log", ctx.page_map.future_log_start),
-    ]
+    y = ctx.layout.index_rows_top
+    row_height = 52
 
-    for i, (text, dest) in enumerate(guide_links):
-        ctx.renderer.add_nav_link(page_idx, text, dest, ctx.layout.content_left, y, ctx.typography.sizes["body"], with_arrow=False)
-        arrow_y = y + ctx.typography.sizes["body"] * 0.65
-        arrow_x = ctx.layout.content_right - 25
-        ctx.renderer.draw_arrow_right(page, arrow_x, arrow_y, ctx.typography.arrow_size_large)
-        arrow_link_rect = (arrow_x - 10, y - 5, ctx.layout.content_right, y + ctx.typography.sizes["body"] + 5)
+    guide_links = [(title, ctx.page_map.guide_start + i) for i, title in enumerate(_GUIDE_TITLES)]
+    guide_links.append(("Future log", ctx.page_map.future_log_start))
+
+    arrow_large = ctx.typography.arrow_size_large
+    arrow_x = content_right - 25
+    # Row-relative offsets are the same for every row
+    guide_arrow_dy = body_size * 0.65
+    for text, dest in guide_links:
+        ctx.renderer.add_nav_link(page_idx, text, dest, content_left, y, body_size, with_arrow=False)
+        arrow_y = y + guide_arrow_dy
+        ctx.renderer.draw_arrow_right(page, arrow_x, arrow_y, arrow_large, shape=shape)
+        arrow_link_rect = (arrow_x - 10, y - 5, content_right, y + body_size + 5)
         ctx.renderer.links.add(page_idx, arrow_link_rect, dest)
-        page.draw_line(
-            fitz.Point(ctx.layout.content_left, y + 40),
-            fitz.Point(ctx.layout.content_right, y + 40),
-            color=ctx.theme.line,
-            width=0.5,
-        )
+        rules.append((content_left, y + 40, content_right, y + 40))
         y += row_height
 
     # Decorative separator between Guide section and calendar tables
-    page.draw_line(
-        fitz.Point(ctx.layout.content_left, y + 10),
-        fitz.Point(ctx.layout.content_right, y + 10),
-        color=ctx.theme.gray,
-        width=1.5,
-    )
+    shape.draw_line((content_left, y + 10), (content_right, y + 10))
+    shape.finish(color=ctx.theme.gray, width=1.5, closePath=False)
     y += 35
 
     month_col_width = 180
-    week_col_start = ctx.layout.content_left + month_col_width + 50
+    week_col_start = content_left + month_col_width + 50
 
-    ctx.renderer.add_text(page, "Monthly logs", ctx.layout.content_left, y, ctx.typography.sizes["body"])
-    ctx.renderer.add_text(page, "Weekly logs", week_col_start, y, ctx.typography.sizes["body"])
+    ctx.renderer.add_text(page, "Monthly logs", content_left, y, body_size)
+    ctx.renderer.add_text(page, "Weekly logs", week_col_start, y, body_size)
     y += 55
 
     available_height = ctx.layout.content_bottom - y - 20
@@ -225,149 +242,180 @@ def generate_main_index(ctx: PageContext, page_idx: int) -> None:
 
     # Calculate dynamic week cell width based on max weeks in any month
     max_weeks_per_month = max(len(weeks) for weeks in weeks_by_month)
-    available_week_width = ctx.layout.content_right - week_col_start
+    available_week_width = content_right - week_col_start
     week_cell_width = available_week_width // max_weeks_per_month
 
     # Track vertical separator position
     sep_x = week_col_start - 25
     sep_y_start = y
 
+    month_arrow_x = content_left + 120
+    arrow_width = arrow_small + 5
+    # Text and arrows sit at the same offsets within every month row
+    text_dy = (month_row_height - small_size) / 2 - 10
+    arrow_dy = small_size * 0.65
+
+    # Week labels, their widths and target pages depend only on the week
+    # number, so they are resolved once per week rather than inside the month loop
+    week_nums = range(1, ctx.calendar.weeks_in_year + 1)
+    week_labels = [f"W{w}" for w in week_nums]
+    week_label_widths = [ctx.renderer.get_text_width(label, small_size) for label in week_labels]
+    week_pages = [ctx.page_map.weekly_action(w - 1) for w in week_nums]
+    # Month and week labels of the grid are written as one text object
+    cell_runs: list[tuple[str, float, float, float, bool]] = []
     for month_idx in range(12):
         month = ctx.calendar.months[month_idx]
         month_page = ctx.page_map.month_timeline(month_idx)
 
-        text_y = y + (month_row_height - ctx.typography.sizes["small"]) / 2 - 10
+        text_y = y + text_dy
+        arrow_y = text_y + arrow_dy
 
-        ctx.renderer.add_text(page, month.name, ctx.layout.content_left, text_y, ctx.typography.sizes["small"])
-        month_arrow_x = ctx.layout.content_left + 120
-        month_arrow_y = text_y + ctx.typography.sizes["small"] * 0.65
-        ctx.renderer.draw_arrow_right(page, month_arrow_x, month_arrow_y, ctx.typography.arrow_size_small)
+        cell_runs.append((month.name, content_left, text_y, small_size, False))
+        ctx.renderer.draw_arrow_right(page, month_arrow_x, arrow_y, arrow_small, shape=shape)
         month_link_rect = (
-            ctx.layout.content_left - 5,
+            content_left - 5,
             text_y - 5,
             month_col_width,
-            text_y + ctx.typography.sizes["small"] + 5,
+            text_y + small_size + 5,
         )
         ctx.renderer.links.add(page_idx, month_link_rect, month_page)
 
-        # Display weeks that primarily belong to this month
+        # Display weeks that primarily belong to this month, each label + arrow
+        # centred within its cell
         month_weeks = weeks_by_month[month_idx]
-        font_size = ctx.typography.sizes["small"]
-        for i, w in enumerate(month_weeks):
-            week_page = ctx.page_map.weekly_action(w - 1)
-
-            # Calculate centered position for week label + arrow within cell
-            week_label = f"W{w}"
-            label_width = ctx.renderer.get_text_width(week_label, font_size)
-            arrow_width = ctx.typography.arrow_size_small + 5
-            total_content_width = label_width + arrow_width
-            cell_start = week_col_start + i * week_cell_width
-            cell_center_offset = (week_cell_width - total_content_width) / 2
-            week_x = cell_start + cell_center_offset
-
-            ctx.renderer.add_text(page, week_label, week_x, text_y, font_size)
-            week_arrow_x = week_x + label_width + 5
-            week_arrow_y = text_y + font_size * 0.65
-            ctx.renderer.draw_arrow_right(page, week_arrow_x, week_arrow_y, ctx.typography.arrow_size_small)
+        week_cells = _week_cell_layout(
+            week_col_start, week_cell_width, [week_label_widths[w - 1] + arrow_width for w in month_weeks]
+        )
+        for w, (cell_start, week_x) in zip(month_weeks, week_cells):
+            cell_runs.append((week_labels[w - 1], week_x, text_y, small_size, False))
+            ctx.renderer.draw_arrow_right(page, week_x + week_label_widths[w - 1] + 5, arrow_y, arrow_small, shape=shape)
 
             # Clickable rect covers entire cell for easy tapping
             week_link_rect = (
                 cell_start,
                 text_y - 10,
                 cell_start + week_cell_width,
-                text_y + font_size + 10,
+                text_y + small_size + 10,
             )
-            ctx.renderer.links.add(page_idx, week_link_rect, week_page)
+            ctx.renderer.links.add(page_idx, week_link_rect, week_pages[w - 1])
 
         line_y = y + month_row_height - 12
-        page.draw_line(
-            fitz.Point(ctx.layout.content_left, line_y),
-            fitz.Point(ctx.layout.content_right, line_y),
-            color=ctx.theme.line,
-            width=0.5,
-        )
+        rules.append((content_left, line_y, content_right, line_y))
         y += month_row_height
 
     # Draw single continuous vertical separator between months and weeks
     sep_y_end = y - 12
-    page.draw_line(
-        fitz.Point(sep_x, sep_y_start),
-        fitz.Point(sep_x, sep_y_end),
-        color=ctx.theme.line,
-        width=0.5,
-    )
+    rules.append((sep_x, sep_y_start, sep_x, sep_y_end))
+    add_line_segments(shape, rules)
+    shape.finish(color=line_color, width=0.5, closePath=False)
+    shape.commit()
 
+    ctx.renderer.draw_text_lines(page, cell_runs)
 
-def generate_year_index(ctx: PageContext, page_idx: int) -> None:
-    page = ctx.renderer.doc[page_idx]
 
-    ctx.renderer.add_text(page, "Index B", ctx.layout.content_left, ctx.layout.content_top + 10, ctx.typography.sizes["title_page"])
-    ctx.renderer.add_text(page, "Daily logs", ctx.layout.content_left, ctx.layout.content_top + 75, ctx.typography.sizes["body"])
+def _day_cell_layout(
+    day_col_start: float, day_spacing: float, days_per_row: int, label_widths: list[float]
+) -> list[tuple[float, float, int]]:
+    """Return (cell left, centred label x, row) for each day, wrapping every ``days_per_row`` days."""
+    cells = []
+    for i, label_width in enumerate(label_widths):
+        link_left = day_col_start + (i % days_per_row) * day_spacing
+        cells.append((link_left, link_left + (day_spacing - label_width) / 2, i // days_per_row))
+    return cells
+
 
-    y = ctx.layout.content_top + 130
+def generate_year_index(ctx: PageContext, page_idx: int) -> None:
+    page = ctx.renderer.page(page_idx)
+
+    content_left = ctx.layout.content_left
+    content_right = ctx.layout.content_right
+    tiny_size = ctx.typography.sizes["tiny"]
+    small_size = ctx.typography.sizes["small"]
+
+    ctx.renderer.add_text(page, "Index B", content_left, ctx.layout.content_top + 10, ctx.typography.sizes["title_page"])
+    ctx.renderer.add_text(page, "Daily logs", content_left, ctx.layout.content_top + 75, ctx.typography.sizes["body"])
+    # Day labels, link rects and separator rules are collected over all months
+    # and handed over in bulk once the page is laid out
+    day_runs: list[tuple[str, float, float, float, bool]] = []
+    link_rects: list[tuple[float, float, float, float]] = []
+    separators: list[tuple[float, float, float, float]] = []
+
+    y = ctx.layout.section_top
     available_height = ctx.layout.content_bottom - y - 60
     month_block_height = available_height // 12
 
     days_per_row = 16
-    day_col_start = ctx.layout.content_left + 115
-    day_col_width = ctx.layout.content_right - day_col_start - 20
+    day_col_start = content_left + 115
+    day_col_width = content_right - day_col_start - 20
     day_spacing = day_col_width / days_per_row
 
+    # Cell geometry depends only on the day number, so it is resolved once for
+    # days 1-31 instead of inside every month
+    day_labels = [str(day) for day in range(1, 32)]
+    day_cells = _day_cell_layout(
+        day_col_start, day_spacing, days_per_row, [ctx.renderer.get_text_width(label, tiny_size) for label in day_labels]
+    )
+
+    # Destination page of every day of the year, indexed by day of year
+    day_pages = ctx.page_map.daily_pages(0, ctx.calendar.total_days)
+
+    # Both day rows and their link padding sit at the same offsets in every
+    # month block
+    row2_dy = month_block_height / 2 + 2
+    row_gap = row2_dy - 8 - tiny_size
+    v_padding = min(8, row_gap / 2 - 1)
+
     for month in ctx.calendar.months:
         row1_y = y + 8
-        row2_y = y + month_block_height / 2 + 2
+        row2_y = y + row2_dy
 
-        ctx.renderer.add_text(page, month.name, ctx.layout.content_left, row1_y, ctx.typography.sizes["small"])
+        ctx.renderer.add_text(page, month.name, content_left, row1_y, small_size)
 
-        row_gap = row2_y - row1_y - ctx.typography.sizes["tiny"]
-        v_padding = min(8, row_gap / 2 - 1)
+        # Days 1-16 sit on the first row and the rest on the second; the
+        # cell table carries each day's row so one loop covers both
+        row_ys = (row1_y, row2_y)
+        for label, (link_left, text_x, row) in zip(day_labels[:month.days], day_cells):
+            row_y = row_ys[row]
+            day_runs.append((label, text_x, row_y, tiny_size, False))
 
-        for day in range(1, min(month.days + 1, 17)):
-            link_left = day_col_start + (day - 1) * day_spacing
-            link_right = link_left + day_spacing
+            link_rects.append((link_left, row_y - v_padding, link_left + day_spacing, row_y + tiny_size + v_padding))
 
-            text_width = ctx.renderer.get_text_width(str(day), ctx.typography.sizes["tiny"])
-            text_x = link_left + (day_spacing - text_width) / 2
-            ctx.renderer.add_text(page, str(day), text_x, row1_y, ctx.typography.sizes["tiny"])
+        line_y = y + month_block_height - 8
+        separators.append((content_left, line_y, content_right, line_y))
 
-            day_of_year = ctx.calendar.day_of_year(month.index, day)
-            dest_page = ctx.page_map.daily_page(day_of_year)
-            link_rect = (link_left, row1_y - v_padding, link_right, row1_y + ctx.typography.sizes["tiny"] + v_padding)
-            ctx.renderer.links.add(page_idx, link_rect, dest_page)
+        y += month_block_height
 
-        for day in range(17, month.days + 1):
-            link_left = day_col_start + (day - 17) * day_spacing
-            link_right = link_left + day_spacing
+    # Month separators share one style, so they are stroked in a single pass
+    shape = page.new_shape()
+    add_line_segments(shape, separators)
+    shape.finish(color=ctx.theme.line, width=0.5, closePath=False)
+    shape.commit()
 
-            text_width = ctx.renderer.get_text_width(str(day), ctx.typography.sizes["tiny"])
-            text_x = link_left + (day_spacing - text_width) / 2
-            ctx.renderer.add_text(page, str(day), text_x, row2_y, ctx.typography.sizes["tiny"])
+    ctx.renderer.draw_text_lines(page, day_runs)
 
-            day_of_year = ctx.calendar.day_of_year(month.index, day)
-            dest_page = ctx.page_map.daily_page(day_of_year)
-            link_rect = (link_left, row2_y - v_padding, link_right, row2_y + ctx.typography.sizes["tiny"] + v_padding)
-            ctx.renderer.links.add(page_idx, link_rect, dest_page)
+    # Rects were collected in day-of-year order, matching the destination table
+    ctx.renderer.links.add_many(page_idx, link_rects, day_pages)
 
-        line_y = y + month_block_height - 8
-        page.draw_line(
-            fitz.Point(ctx.layout.content_left, line_y),
-            fitz.Point(ctx.layout.content_right, line_y),
-            color=ctx.theme.line,
-            width=0.5,
-        )
+    ctx.renderer.add_bottom_nav(page_idx, [("Index", ctx.page_map.main_index)])
 
-        y += month_block_height
 
-    ctx.renderer.add_bottom_nav(page_idx, [("Index", ctx.page_map.main_index)])
+def _draw_page_header(ctx: PageContext, page_idx: int, title: str, title_size: str = "title_page") -> None:
+    """Draw the "Index" back link and the page title shared by most section pages."""
+    ctx.renderer.add_nav_link(page_idx, "Index", ctx.page_map.main_index, ctx.layout.content_left, ctx.layout.nav_y)
+    ctx.renderer.add_text(
+        ctx.renderer.page(page_idx), title, ctx.layout.content_left, ctx.layout.title_y, ctx.typography.sizes[title_size]
+    )
 
 
 def generate_collection_index(ctx: PageContext, page_idx: int, letter: str) -> None:
-    page = ctx.renderer.doc[page_idx]
+    page = ctx.renderer.page(page_idx)
+    content_left = ctx.layout.content_left
+    content_right = ctx.layout.content_right
+    line_color = ctx.theme.line
 
-    ctx.renderer.add_nav_link(page_idx, "Index", ctx.page_map.main_index, ctx.layout.content_left, ctx.layout.content_top + 5)
-    ctx.renderer.add_text(page, f"Index {letter}", ctx.layout.content_left, ctx.layout.content_top + 50, ctx.typography.sizes["title_page"])
+    _draw_page_header(ctx, page_idx, f"Index {letter}")
 
-    y = ctx.layout.content_top + 130
+    y = ctx.layout.section_top
     num_lines = ctx.settings.num_collections_per_index
 
     # Calculate dynamic line spacing to utilize available space
@@ -376,54 +424,82 @@ def generate_collection_index(ctx: PageContext, page_idx: int, letter: str) -> N
     line_spacing = available_height // num_lines
 
     collection_offset = 0 if letter == "C" else ctx.settings.num_collections_per_index
+    row_tops = [y + i * line_spacing for i in range(num_lines)]
+
+    # Row rules and arrows are the same on every collection index, so they are
+    # drawn once into a shared form; row rules are stroked as a single path
+    def draw_rows(shape: fitz.Shape) -> None:
+        arrow_x = content_right - 22
+        arrow_size = ctx.typography.arrow_size_large
+        for line_y in row_tops:
+            ctx.renderer.draw_arrow_right(page, arrow_x, line_y + line_spacing / 2, arrow_size, shape=shape)
+        bottom_line_y = y + num_lines * line_spacing
+        rules = [(content_left, line_y, content_right, line_y) for line_y in row_tops + [bottom_line_y]]
+        add_line_segments(shape, rules)
+        shape.finish(color=line_color, width=0.5, closePath=False)
+
+    ctx.renderer.stamp_form(page, ("collection_index_rows", y, line_spacing, num_lines), draw_rows)
+
+    # Make entire row clickable
+    link_rects = [(content_left, line_y, content_right, line_y + line_spacing) for line_y in row_tops]
+    collection_pages = [ctx.page_map.collection_page(collection_offset + i) for i in range(num_lines)]
+    ctx.renderer.links.add_many(page_idx, link_rects, collection_pages)
 
-    for i in range(num_lines):
-        line_y = y + i * line_spacing
-        page.draw_line(
-            fitz.Point(ctx.layout.content_left, line_y),
-            fitz.Point(ctx.layout.content_right, line_y),
-            color=ctx.theme.line,
-            width=0.5,
-        )
+    ctx.renderer.draw_footer_section(page, FOOTER_TEXTS["collection_index"])
 
-        arrow_y = line_y + line_spacing / 2
-        arrow_x = ctx.layout.content_right - 22
-        ctx.renderer.draw_arrow_right(page, arrow_x, arrow_y, ctx.typography.arrow_size_large)
 
-        collection_idx = collection_offset + i
-        collection_page = ctx.page_map.collection_page(collection_idx)
-        # Make entire row clickable
-        link_rect = (ctx.layout.content_left, line_y, ctx.layout.content_right, line_y + line_spacing)
-        ctx.renderer.links.add(page_idx, link_rect, collection_page)
+# Symbol geometry for the Symbol Reference page. Each helper adds its paths to
+# the given shape; stroke style is chosen by the shape the caller passes in.
+def _draw_dash(shape: fitz.Shape, x: float, y: float, size: float) -> None:
+    add_line_segments(shape, ((x, y, x + size, y),))
 
-    bottom_line_y = y + num_lines * line_spacing
-    page.draw_line(
-        fitz.Point(ctx.layout.content_left, bottom_line_y),
-        fitz.Point(ctx.layout.content_right, bottom_line_y),
-        color=ctx.theme.line,
-        width=0.5,
-    )
 
-    ctx.renderer.draw_footer_section(page, FOOTER_TEXTS["collection_index"])
+def _draw_circle(shape: fitz.Shape, x: float, y: float, r: float) -> None:
+    shape.draw_circle((x + r, y), r)
+
+
+def _draw_double_line(shape: fitz.Shape, x: float, y: float, size: float, gap: float) -> None:
+    add_line_segments(shape, ((x, y - gap, x + size, y - gap), (x, y + gap, x + size, y + gap)))
+
+
+def _draw_x_mark(shape: fitz.Shape, x: float, y: float, size: float) -> None:
+    half = size / 2
+    add_line_segments(shape, ((x, y - half, x + size, y + half), (x, y + half, x + size, y - half)))
+
+
+def _draw_chevron_right(shape: fitz.Shape, x: float, y: float, size: float) -> None:
+    half = size / 2
+    add_line_segments(shape, ((x, y - half, x + size, y), (x, y + half, x + size, y)))
+
+
+def _draw_chevron_left(shape: fitz.Shape, x: float, y: float, size: float) -> None:
+    half = size / 2
+    add_line_segments(shape, ((x + size, y - half, x, y), (x + size, y + half, x, y)))
 
 
 def generate_guide_symbol_reference(ctx: PageContext, page_idx: int) -> None:
     """Generate Symbol Reference page - quick reference for all symbols with elegant design."""
-    page = ctx.renderer.doc[page_idx]
+    page = ctx.renderer.page(page_idx)
+    # Paths are grouped by style: each group is one shape, finished and
+    # committed once after the whole page is laid out
+    batch = StrokeBatch(page)
+    rules = batch.shape(**ctx.renderer.rule_style)
+    strokes = batch.shape(color=ctx.theme.black, width=2.2, closePath=False)
+    bold_strokes = batch.shape(color=ctx.theme.black, width=2.8, closePath=False)
+    dots = batch.shape(color=ctx.theme.black, fill=ctx.theme.black)
     font_header = 35
     font_section = 28
     font_desc = 28
     line_height = 1.8
 
-    ctx.renderer.add_nav_link(page_idx, "Index", ctx.page_map.main_index, ctx.layout.content_left, ctx.layout.content_top + 5)
-    ctx.renderer.add_text(page, "Symbol Reference", ctx.layout.content_left, ctx.layout.content_top + 50, ctx.typography.sizes["header"])
+    _draw_page_header(ctx, page_idx, "Symbol Reference", "header")
 
     # Card dimensions and positions
     card_gap = 25
     card_padding = 20
     content_width = ctx.layout.content_width
     card_width = (content_width - card_gap * 2) // 3
-    y_start = ctx.layout.content_top + 130
+    y_start = ctx.layout.section_top
 
     # Card heights - calculate based on content
     card1_rows = 4  # N.A.M.E.
@@ -440,44 +516,32 @@ def generate_guide_symbol_reference(ctx: PageContext, page_idx: int) -> None:
 
     # Draw card backgrounds with subtle borders
     for card_x in [card1_x, card2_x, card3_x]:
-        page.draw_rect(
-            fitz.Rect(card_x, y_start, card_x + card_width, y_start + card_height),
-            color=ctx.theme.gray,
-            width=0.5,
-        )
+        rules.draw_rect((card_x, y_start, card_x + card_width, y_start + card_height))
 
     symbol_x_offset = card_padding + 5
     desc_x_offset = card_padding + 50
 
-    # Helper to draw symbols
-    def draw_dash(x: float, y: float, size: int = 14) -> None:
-        page.draw_line(fitz.Point(x, y), fitz.Point(x + size, y), color=ctx.theme.black, width=2.2)
-
-    def draw_dot(x: float, y: float, r: int = 5) -> None:
-        page.draw_circle(fitz.Point(x + r, y), r, color=ctx.theme.black, fill=ctx.theme.black)
-
-    def draw_double_line(x: float, y: float, size: int = 14) -> None:
-        for offset in [-4, 4]:
-            page.draw_line(fitz.Point(x, y + offset), fitz.Point(x + size, y + offset), color=ctx.theme.black, width=1.8)
-
-    def draw_circle_outline(x: float, y: float, r: int = 6) -> None:
-        page.draw_circle(fitz.Point(x + r, y), r, color=ctx.theme.black, width=2)
-
-    def draw_x_mark(x: float, y: float, size: int = 10) -> None:
-        page.draw_line(fitz.Point(x, y - size / 2), fitz.Point(x + size, y + size / 2), color=ctx.theme.black, width=2.2)
-        page.draw_line(fitz.Point(x, y + size / 2), fitz.Point(x + size, y - size / 2), color=ctx.theme.black, width=2.2)
-
-    def draw_arrow_right(x: float, y: float, size: int = 10) -> None:
-        page.draw_line(fitz.Point(x, y - size / 2), fitz.Point(x + size, y), color=ctx.theme.black, width=2.2)
-        page.draw_line(fitz.Point(x, y + size / 2), fitz.Point(x + size, y), color=ctx.theme.black, width=2.2)
+    # Card symbols, bound to their stroke style and size
+    draw_dash = partial(_draw_dash, strokes, size=14)
+    draw_dot = partial(_draw_circle, dots, r=5)
+    draw_double_line = partial(
+        _draw_double_line, batch.shape(color=ctx.theme.black, width=1.8, closePath=False), size=14, gap=4
+    )
+    draw_circle_outline = partial(_draw_circle, batch.shape(color=ctx.theme.black, width=2), r=6)
+    draw_x_mark = partial(_draw_x_mark, strokes, size=10)
+    draw_arrow_right = partial(_draw_chevron_right, strokes, size=10)
+    draw_arrow_left = partial(_draw_chevron_left, strokes, size=10)
 
-    def draw_arrow_left(x: float, y: float, size: int = 10) -> None:
-        page.draw_line(fitz.Point(x + size, y - size / 2), fitz.Point(x, y), color=ctx.theme.black, width=2.2)
-        page.draw_line(fitz.Point(x + size, y + size / 2), fitz.Point(x, y), color=ctx.theme.black, width=2.2)
+    # Loop-invariant column positions and row offsets shared by all cards
+    sym_offset = font_desc * 0.55
+    card_title_y = y_start + card_padding
+    first_row_y = card_title_y + 45
 
     # Card 1: Rapid Logging (N.A.M.E.)
-    ctx.renderer.add_text(page, "Rapid Logging", card1_x + card_padding, y_start + card_padding, font_section)
-    y = y_start + card_padding + 45
+    ctx.renderer.add_text(page, "Rapid Logging", card1_x + card_padding, card_title_y, font_section)
+    sym_x = card1_x + symbol_x_offset
+    desc_x = card1_x + desc_x_offset
+    y = first_row_y
 
     items1 = [
         (draw_dash, "Notes"),
@@ -486,67 +550,51 @@ def generate_guide_symbol_reference(ctx: PageContext, page_idx: int) -> None:
         (draw_circle_outline, "Events"),
     ]
     for draw_fn, label in items1:
-        sym_y = y + font_desc * 0.55
-        draw_fn(card1_x + symbol_x_offset, sym_y)
-        ctx.renderer.add_text(page, label, card1_x + desc_x_offset, y, font_desc)
+        draw_fn(sym_x, y + sym_offset)
+        ctx.renderer.add_text(page, label, desc_x, y, font_desc)
         y += row_height
 
     # Card 2: Action States
-    ctx.renderer.add_text(page, "Action States", card2_x + card_padding, y_start + card_padding, font_section)
-    y = y_start + card_padding + 45
-
-    # Incomplete
-    sym_y = y + font_desc * 0.55
-    draw_dot(card2_x + symbol_x_offset, sym_y)
-    ctx.renderer.add_text(page, "Incomplete", card2_x + desc_x_offset, y, font_desc)
-    y += row_height
-
-    # Complete
-    sym_y = y + font_desc * 0.55
-    draw_x_mark(card2_x + symbol_x_offset, sym_y)
-    ctx.renderer.add_text(page, "Complete", card2_x + desc_x_offset, y, font_desc)
-    y += row_height
-
-    # Migrated
-    sym_y = y + font_desc * 0.55
-    draw_arrow_right(card2_x + symbol_x_offset, sym_y)
-    ctx.renderer.add_text(page, "Migrated", card2_x + desc_x_offset, y, font_desc)
-    y += row_height
-
-    # Scheduled
-    sym_y = y + font_desc * 0.55
-    draw_arrow_left(card2_x + symbol_x_offset, sym_y)
-    ctx.renderer.add_text(page, "Scheduled", card2_x + desc_x_offset, y, font_desc)
-    y += row_height
-
-    # Irrelevant
-    sym_y = y + font_desc * 0.55
-    draw_dot(card2_x + symbol_x_offset, sym_y)
-    ctx.renderer.add_text(page, "Irrelevant", card2_x + desc_x_offset, y, font_desc)
+    ctx.renderer.add_text(page, "Action States", card2_x + card_padding, card_title_y, font_section)
+    sym_x = card2_x + symbol_x_offset
+    desc_x = card2_x + desc_x_offset
+    y = first_row_y
+
+    items2 = [
+        (draw_dot, "Incomplete"),
+        (draw_x_mark, "Complete"),
+        (draw_arrow_right, "Migrated"),
+        (draw_arrow_left, "Scheduled"),
+        (draw_dot, "Irrelevant"),
+    ]
+    for draw_fn, label in items2:
+        sym_y = y + sym_offset
+        draw_fn(sym_x, sym_y)
+        ctx.renderer.add_text(page, label, desc_x, y, font_desc)
+        y += row_height
+
+    # Irrelevant (the last row) is struck through
     text_width = ctx.renderer.get_text_width("Irrelevant", font_desc)
-    page.draw_line(fitz.Point(card2_x + symbol_x_offset, sym_y), fitz.Point(card2_x + desc_x_offset + text_width, sym_y), color=ctx.theme.black, width=1)
+    batch.shape(color=ctx.theme.black, width=1, closePath=False).draw_line(
+        (sym_x, sym_y), (desc_x + text_width, sym_y)
+    )
 
     # Card 3: Signifiers
-    ctx.renderer.add_text(page, "Signifiers", card3_x + card_padding, y_start + card_padding, font_section)
-    y = y_start + card_padding + 45
+    ctx.renderer.add_text(page, "Signifiers", card3_x + card_padding, card_title_y, font_section)
+    sym_x = card3_x + symbol_x_offset + 6
+    desc_x = card3_x + desc_x_offset
+    y = first_row_y
     icon_size = 12
 
-    # Priority
-    sym_y = y + font_desc * 0.55
-    ctx.renderer.draw_star(page, card3_x + symbol_x_offset + 6, sym_y, icon_size)
-    ctx.renderer.add_text(page, "Priority", card3_x + desc_x_offset, y, font_desc)
-    y += row_height
-
-    # Inspiration
-    sym_y = y + font_desc * 0.6
-    ctx.renderer.draw_lightbulb(page, card3_x + symbol_x_offset + 6, sym_y, icon_size)
-    ctx.renderer.add_text(page, "Inspiration", card3_x + desc_x_offset, y, font_desc)
-    y += row_height
-
-    # Explore
-    sym_y = y + font_desc * 0.55
-    ctx.renderer.draw_eye(page, card3_x + symbol_x_offset + 6, sym_y, icon_size)
-    ctx.renderer.add_text(page, "Explore", card3_x + desc_x_offset, y, font_desc)
+    items3 = [
+        (ctx.renderer.draw_star, "Priority", sym_offset),
+        (ctx.renderer.draw_lightbulb, "Inspiration", font_desc * 0.6),
+        (ctx.renderer.draw_eye, "Explore", sym_offset),
+    ]
+    for draw_fn, label, icon_offset in items3:
+        draw_fn(page, sym_x, y + icon_offset, icon_size)
+        ctx.renderer.add_text(page, label, desc_x, y, font_desc)
+        y += row_height
 
     # Example section - calculate available space and distribute evenly
     example_start_y = y_start + card_height + 50
@@ -555,11 +603,9 @@ def generate_guide_symbol_reference(ctx: PageContext, page_idx: int) -> None:
     # Section title with decorative line
     ctx.renderer.add_text(page, "Example", ctx.layout.content_left, example_start_y, font_header)
     title_width = ctx.renderer.get_text_width("Example", font_header)
-    page.draw_line(
-        fitz.Point(ctx.layout.content_left + title_width + 15, example_start_y + font_header * 0.5),
-        fitz.Point(ctx.layout.content_right, example_start_y + font_header * 0.5),
-        color=ctx.theme.gray,
-        width=0.5,
+    rules.draw_line(
+        (ctx.layout.content_left + title_width + 15, example_start_y + font_header * 0.5),
+        (ctx.layout.content_right, example_start_y + font_header * 0.5),
     )
 
     # Scenario subtitle
@@ -587,18 +633,11 @@ def generate_guide_symbol_reference(ctx: PageContext, page_idx: int) -> None:
 
     # Subtle header underline
     underline_y = header_y + 35
-    page.draw_line(
-        fitz.Point(ctx.layout.content_left, underline_y),
-        fitz.Point(ctx.layout.content_left + left_col_width - 30, underline_y),
-        color=ctx.theme.gray,
-        width=0.5,
-    )
-    page.draw_line(
-        fitz.Point(right_col_x, underline_y),
-        fitz.Point(ctx.layout.content_right, underline_y),
-        color=ctx.theme.gray,
-        width=0.5,
+    rules.draw_line(
+        (ctx.layout.content_left, underline_y),
+        (ctx.layout.content_left + left_col_width - 30, underline_y),
     )
+    rules.draw_line((right_col_x, underline_y), (ctx.layout.content_right, underline_y))
 
     example_y = underline_y + 20
 
@@ -612,30 +651,13 @@ def generate_guide_symbol_reference(ctx: PageContext, page_idx: int) -> None:
     ex_arrow = 13
     ex_x = 13
 
-    def draw_ex_dot(x: float, y: float) -> None:
-        page.draw_circle(fitz.Point(x + ex_dot_r, y), ex_dot_r, color=ctx.theme.black, fill=ctx.theme.black)
-
-    def draw_ex_dash(x: float, y: float) -> None:
-        page.draw_line(fitz.Point(x, y), fitz.Point(x + 18, y), color=ctx.theme.black, width=2.8)
-
-    def draw_ex_double(x: float, y: float) -> None:
-        for offset in [-6, 6]:
-            page.draw_line(fitz.Point(x, y + offset), fitz.Point(x + 18, y + offset), color=ctx.theme.black, width=2.2)
-
-    def draw_ex_circle(x: float, y: float) -> None:
-        page.draw_circle(fitz.Point(x + 8, y), 8, color=ctx.theme.black, width=2.8)
-
-    def draw_ex_x(x: float, y: float) -> None:
-        page.draw_line(fitz.Point(x, y - ex_x / 2), fitz.Point(x + ex_x, y + ex_x / 2), color=ctx.theme.black, width=2.8)
-        page.draw_line(fitz.Point(x, y + ex_x / 2), fitz.Point(x + ex_x, y - ex_x / 2), color=ctx.theme.black, width=2.8)
-
-    def draw_ex_migrate(x: float, y: float) -> None:
-        page.draw_line(fitz.Point(x, y - ex_arrow / 2), fitz.Point(x + ex_arrow, y), color=ctx.theme.black, width=2.8)
-        page.draw_line(fitz.Point(x, y + ex_arrow / 2), fitz.Point(x + ex_arrow, y), color=ctx.theme.black, width=2.8)
-
-    def draw_ex_schedule(x: float, y: float) -> None:
-        page.draw_line(fitz.Point(x + ex_arrow, y - ex_arrow / 2), fitz.Point(x, y), color=ctx.theme.black, width=2.8)
-        page.draw_line(fitz.Point(x + ex_arrow, y + ex_arrow / 2), fitz.Point(x, y), color=ctx.theme.black, width=2.8)
+    draw_ex_dot = partial(_draw_circle, dots, r=ex_dot_r)
+    draw_ex_dash = partial(_draw_dash, bold_strokes, size=18)
+    draw_ex_double = partial(_draw_double_line, strokes, size=18, gap=6)
+    draw_ex_circle = partial(_draw_circle, batch.shape(color=ctx.theme.black, width=2.8), r=8)
+    draw_ex_x = partial(_draw_x_mark, bold_strokes, size=ex_x)
+    draw_ex_migrate = partial(_draw_chevron_right, bold_strokes, size=ex_arrow)
+    draw_ex_schedule = partial(_draw_chevron_left, bold_strokes, size=ex_arrow)
 
     # Example rows - each with clear structure
     left_x = ctx.layout.content_left
@@ -672,7 +694,9 @@ def generate_guide_symbol_reference(ctx: PageContext, page_idx: int) -> None:
     striketext = "Print invites"
     ctx.renderer.add_text(page, striketext, right_col_x, example_y, font_hw, italic=True)
     strike_w = ctx.renderer.get_text_width(striketext, font_hw)
-    page.draw_line(fitz.Point(right_col_x, sym_y), fitz.Point(right_col_x + strike_w, sym_y), color=ctx.theme.black, width=1.5)
+    batch.shape(color=ctx.theme.black, width=1.5, closePath=False).draw_line(
+        (right_col_x, sym_y), (right_col_x + strike_w, sym_y)
+    )
     ctx.renderer.add_text(page, "use group chat", right_col_x + strike_w + 15, example_y + 10, font_note, italic=True)
     example_y += line_h
 
@@ -707,18 +731,99 @@ def generate_guide_symbol_reference(ctx: PageContext, page_idx: int) -> None:
     ctx.renderer.add_text(page, "Nervous", left_x + text_col, example_y, font_hw, italic=True)
     ctx.renderer.add_text(page, "^", right_col_x + 6, example_y, font_hw, italic=True)
     ctx.renderer.add_text(page, "moved toward my goal", right_col_x + 35, example_y + 10, font_note, italic=True)
+    batch.commit()
+
+
+def _draw_name_symbol(batch: StrokeBatch, color: tuple, sym_type: str, cx: float, cy: float, size: float = 20) -> None:
+    if sym_type == "dash":
+        batch.shape(color=color, width=3, closePath=False).draw_line((cx - size / 2, cy), (cx + size / 2, cy))
+    elif sym_type == "dot":
+        batch.shape(color=color, fill=color).draw_circle((cx, cy), size / 3)
+    elif sym_type == "double":
+        shape = batch.shape(color=color, width=2.5, closePath=False)
+        for offset in [-size / 4, size / 4]:
+            shape.draw_line((cx - size / 2, cy + offset), (cx + size / 2, cy + offset))
+    elif sym_type == "circle":
+        batch.shape(color=color, width=2.5).draw_circle((cx, cy), size / 3)
+
+
+def _section_title(ctx: PageContext, title_runs: list, rules: fitz.Shape, text: str, y: float) -> None:
+    """Queue a subheader title run and its trailing rule out to the right margin.
+
+    The caller writes ``title_runs`` with ``draw_text_lines`` and commits ``rules``.
+    """
+    size = ctx.typography.sizes["subheader"]
+    title_w = ctx.renderer.get_text_width(text, size)
+    title_runs.append((text, ctx.layout.content_left, y, size, False))
+    rule_y = y + size * 0.45
+    add_line_segments(rules, ((ctx.layout.content_left + title_w + 15, rule_y, ctx.layout.content_right, rule_y),))
+
+
+# Line-drawn symbols as (x0, y0, x1, y1) segments in units of the symbol size,
+# relative to its centre
+_STATE_SYMBOL_LINES = {
+    "x": ((-0.5, -0.5, 0.5, 0.5), (-0.5, 0.5, 0.5, -0.5)),
+    "arrow_r": ((-0.5, -1 / 3, 0.5, 0.0), (-0.5, 1 / 3, 0.5, 0.0)),
+    "arrow_l": ((0.5, -1 / 3, -0.5, 0.0), (0.5, 1 / 3, -0.5, 0.0)),
+}
+
+
+def _scaled_segments(unit_segments, cx: float, cy: float, size: float) -> list[tuple[float, float, float, float]]:
+    return [(cx + x0 * size, cy + y0 * size, cx + x1 * size, cy + y1 * size) for x0, y0, x1, y1 in unit_segments]
+
+
+def _draw_state_symbol(batch: StrokeBatch, color: tuple, sym_type: str, cx: float, cy: float, size: float = 16) -> None:
+    unit_segments = _STATE_SYMBOL_LINES.get(sym_type)
+    if unit_segments is not None:
+        add_line_segments(batch.shape(color=color, width=2.8, closePath=False), _scaled_segments(unit_segments, cx, cy, size))
+    elif sym_type == "dot":
+        batch.shape(color=color, fill=color).draw_circle((cx, cy), size / 3)
+    elif sym_type == "strike":
+        # Dot with strikethrough extending to the right (simulating crossed-out text)
+        batch.shape(color=color, fill=color).draw_circle((cx, cy), size / 3)
+        batch.shape(color=color, width=1.5, closePath=False).draw_line((cx + size / 2, cy), (cx + size * 2.5, cy))
+
+
+# The System page: N.A.M.E. cards (letter, name, symbol, description),
+# action states (label, symbol) and signifier cards (icon, name, description)
+_NAME_ITEMS = (
+    ("N", "Notes", "dash", "Ideas, insights, information to remember. Capture what you learn."),
+    ("A", "Actions", "dot", "Things to do - your tasks. The backbone of your productivity."),
+    ("M", "Moods", "double", "How you feel, emotionally or physically. Track your inner state."),
+    ("E", "Events", "circle", "Experiences, appointments, milestones. Record what happens."),
+)
+
+_ACTION_STATES = (
+    ("Incomplete", "dot"),
+    ("Complete", "x"),
+    ("Migrated", "arrow_r"),
+    ("Scheduled", "arrow_l"),
+    ("Irrelevant", "strike"),
+)
+
+_SIGNIFIERS = (
+    ("star", "Priority", "Important and urgent"),
+    ("lightbulb", "Inspiration", "Great idea worth remembering"),
+    ("eye", "Explore", "Requires further research"),
+)
 
 
 def generate_guide_system(ctx: PageContext, page_idx: int) -> None:
     """Generate The System page - elegant card-based layout for N.A.M.E. framework."""
-    page = ctx.renderer.doc[page_idx]
+    page = ctx.renderer.page(page_idx)
+    # Section rules, card borders and the N.A.M.E./state symbols are grouped
+    # by style, each group drawn as a single path and committed once beneath
+    # the page's text
+    batch = StrokeBatch(page)
+    rules = batch.shape(**ctx.renderer.rule_style)
+    borders = batch.shape(**ctx.renderer.border_style)
+    title_runs: list = []
     font_body = 28
     font_section = 25
     font_small = 25
     line_height = 1.45
 
-    ctx.renderer.add_nav_link(page_idx, "Index", ctx.page_map.main_index, ctx.layout.content_left, ctx.layout.content_top + 5)
-    ctx.renderer.add_text(page, "The System", ctx.layout.content_left, ctx.layout.content_top + 50, ctx.typography.sizes["header"])
+    _draw_page_header(ctx, page_idx, "The System", "header")
 
     # Layout uses dynamic sizing to fill available space evenly
 
@@ -733,14 +838,7 @@ def generate_guide_system(ctx: PageContext, page_idx: int) -> None:
     y += height + 35
 
     # N.A.M.E. Section with decorative title
-    ctx.renderer.add_text(page, "N.A.M.E.", ctx.layout.content_left, y, ctx.typography.sizes["subheader"])
-    title_w = ctx.renderer.get_text_width("N.A.M.E.", ctx.typography.sizes["subheader"])
-    page.draw_line(
-        fitz.Point(ctx.layout.content_left + title_w + 15, y + ctx.typography.sizes["subheader"] * 0.45),
-        fitz.Point(ctx.layout.content_right, y + ctx.typography.sizes["subheader"] * 0.45),
-        color=ctx.theme.gray,
-        width=0.5,
-    )
+    _section_title(ctx, title_runs, rules, "N.A.M.E.", y)
     y += 45
 
     # N.A.M.E. cards - 2x2 grid with larger cards
@@ -749,13 +847,6 @@ def generate_guide_system(ctx: PageContext, page_idx: int) -> None:
     card_height = 168  # Increased from 150
     card_padding = 22  # Increased from 18
 
-    name_items = [
-        ("N", "Notes", "dash", "Ideas, insights, information to remember. Capture what you learn."),
-        ("A", "Actions", "dot", "Things to do - your tasks. The backbone of your productivity."),
-        ("M", "Moods", "double", "How you feel, emotionally or physically. Track your inner state."),
-        ("E", "Events", "circle", "Experiences, appointments, milestones. Record what happens."),
-    ]
-
     positions = [
         (ctx.layout.content_left, y),
         (ctx.layout.content_left + card_width + card_gap, y),
@@ -763,25 +854,10 @@ def generate_guide_system(ctx: PageContext, page_idx: int) -> None:
         (ctx.layout.content_left + card_width + card_gap, y + card_height + card_gap),
     ]
 
-    def draw_symbol(sym_type: str, cx: float, cy: float, size: int = 20) -> None:
-        if sym_type == "dash":
-            page.draw_line(fitz.Point(cx - size / 2, cy), fitz.Point(cx + size / 2, cy), color=ctx.theme.black, width=3)
-        elif sym_type == "dot":
-            page.draw_circle(fitz.Point(cx, cy), size / 3, color=ctx.theme.black, fill=ctx.theme.black)
-        elif sym_type == "double":
-            for offset in [-size / 4, size / 4]:
-                page.draw_line(fitz.Point(cx - size / 2, cy + offset), fitz.Point(cx + size / 2, cy + offset), color=ctx.theme.black, width=2.5)
-        elif sym_type == "circle":
-            page.draw_circle(fitz.Point(cx, cy), size / 3, color=ctx.theme.black, width=2.5)
-
-    for i, (letter, name, sym_type, desc) in enumerate(name_items):
+    for i, (letter, name, sym_type, desc) in enumerate(_NAME_ITEMS):
         cx, cy = positions[i]
         # Card border
-        page.draw_rect(
-            fitz.Rect(cx, cy, cx + card_width, cy + card_height),
-            color=ctx.theme.gray,
-            width=0.5,
-        )
+        borders.draw_rect((cx, cy, cx + card_width, cy + card_height))
         # Large letter
         letter_x = cx + card_padding
         letter_y = cy + card_padding
@@ -789,7 +865,7 @@ def generate_guide_system(ctx: PageContext, page_idx: int) -> None:
         # Symbol after letter - increased spacing to prevent overlap
         sym_x = letter_x + 55
         sym_y = letter_y + 26
-        draw_symbol(sym_type, sym_x, sym_y, 22)
+        _draw_name_symbol(batch, ctx.theme.black, sym_type, sym_x, sym_y, 22)
         # Name - adjusted position for new symbol spacing
         ctx.renderer.add_text(page, name, cx + card_padding + 90, letter_y + 8, font_section + 2)
         # Description - multi-line with more vertical space
@@ -798,14 +874,7 @@ def generate_guide_system(ctx: PageContext, page_idx: int) -> None:
     y = positions[2][1] + card_height + 38
 
     # Action States - horizontal flow with clearer design
-    ctx.renderer.add_text(page, "Action States", ctx.layout.content_left, y, ctx.typography.sizes["subheader"])
-    title_w = ctx.renderer.get_text_width("Action States", ctx.typography.sizes["subheader"])
-    page.draw_line(
-        fitz.Point(ctx.layout.content_left + title_w + 15, y + ctx.typography.sizes["subheader"] * 0.45),
-        fitz.Point(ctx.layout.content_right, y + ctx.typography.sizes["subheader"] * 0.45),
-        color=ctx.theme.gray,
-        width=0.5,
-    )
+    _section_title(ctx, title_runs, rules, "Action States", y)
     y += 32
 
     # Explanation text
@@ -816,63 +885,31 @@ def generate_guide_system(ctx: PageContext, page_idx: int) -> None:
     # Flow diagram - 5 states in a row
     flow_y = y + 28
     state_spacing = ctx.layout.content_width // 5
-    states = [
-        ("Incomplete", "dot"),
-        ("Complete", "x"),
-        ("Migrated", "arrow_r"),
-        ("Scheduled", "arrow_l"),
-        ("Irrelevant", "strike"),
-    ]
 
-    def draw_state_symbol(sym_type: str, cx: float, cy: float, size: int = 16) -> None:
-        if sym_type == "dot":
-            page.draw_circle(fitz.Point(cx, cy), size / 3, color=ctx.theme.black, fill=ctx.theme.black)
-        elif sym_type == "x":
-            hs = size / 2
-            page.draw_line(fitz.Point(cx - hs, cy - hs), fitz.Point(cx + hs, cy + hs), color=ctx.theme.black, width=2.8)
-            page.draw_line(fitz.Point(cx - hs, cy + hs), fitz.Point(cx + hs, cy - hs), color=ctx.theme.black, width=2.8)
-        elif sym_type == "arrow_r":
-            page.draw_line(fitz.Point(cx - size / 2, cy - size / 3), fitz.Point(cx + size / 2, cy), color=ctx.theme.black, width=2.8)
-            page.draw_line(fitz.Point(cx - size / 2, cy + size / 3), fitz.Point(cx + size / 2, cy), color=ctx.theme.black, width=2.8)
-        elif sym_type == "arrow_l":
-            page.draw_line(fitz.Point(cx + size / 2, cy - size / 3), fitz.Point(cx - size / 2, cy), color=ctx.theme.black, width=2.8)
-            page.draw_line(fitz.Point(cx + size / 2, cy + size / 3), fitz.Point(cx - size / 2, cy), color=ctx.theme.black, width=2.8)
-        elif sym_type == "strike":
-            # Dot with strikethrough extending to the right (simulating crossed-out text)
-            page.draw_circle(fitz.Point(cx, cy), size / 3, color=ctx.theme.black, fill=ctx.theme.black)
-            page.draw_line(fitz.Point(cx + size / 2, cy), fitz.Point(cx + size * 2.5, cy), color=ctx.theme.black, width=1.5)
-
-    # Draw states
-    for i, (name, sym_type) in enumerate(states):
+    # Draw states; the labels are written together as one text object
+    label_runs = []
+    for i, (name, sym_type) in enumerate(_ACTION_STATES):
         sx = ctx.layout.content_left + state_spacing * i + state_spacing // 2
         # Symbol
-        draw_state_symbol(sym_type, sx, flow_y, 16)
+        _draw_state_symbol(batch, ctx.theme.black, sym_type, sx, flow_y, 16)
         # Label below with more space
         label_w = ctx.renderer.get_text_width(name, font_small)
-        ctx.renderer.add_text(page, name, sx - label_w // 2, flow_y + 35, font_small)
+        label_runs.append((name, sx - label_w // 2, flow_y + 35, font_small, False))
+    ctx.renderer.draw_text_lines(page, label_runs)
 
     # Draw connecting line from Incomplete through all states
     first_x = ctx.layout.content_left + state_spacing // 2 + 20
     last_x = ctx.layout.content_left + state_spacing * 4 + state_spacing // 2 - 20
     page.draw_line(
-        fitz.Point(first_x, flow_y),
-        fitz.Point(last_x, flow_y),
-        color=ctx.theme.gray,
-        width=1,
-        dashes="[4 4]",
+        (first_x, flow_y),
+        (last_x, flow_y),
+        **ctx.renderer.connector_style,
     )
 
     y = flow_y + 95
 
     # Signifiers section
-    ctx.renderer.add_text(page, "Signifiers", ctx.layout.content_left, y, ctx.typography.sizes["subheader"])
-    title_w = ctx.renderer.get_text_width("Signifiers", ctx.typography.sizes["subheader"])
-    page.draw_line(
-        fitz.Point(ctx.layout.content_left + title_w + 15, y + ctx.typography.sizes["subheader"] * 0.45),
-        fitz.Point(ctx.layout.content_right, y + ctx.typography.sizes["subheader"] * 0.45),
-        color=ctx.theme.gray,
-        width=0.5,
-    )
+    _section_title(ctx, title_runs, rules, "Signifiers", y)
     y += 36
 
     signifier_intro = "Add context to any bullet by placing a signifier in front:"
@@ -885,20 +922,11 @@ def generate_guide_system(ctx: PageContext, page_idx: int) -> None:
     sig_card_height = 165  # Increased from 145
     sig_padding = 24  # Increased from 20
 
-    signifiers = [
-        ("star", "Priority", "Important and urgent"),
-        ("lightbulb", "Inspiration", "Great idea worth remembering"),
-        ("eye", "Explore", "Requires further research"),
-    ]
-
-    for i, (icon_type, name, desc) in enumerate(signifiers):
+    signifier_runs = []
+    for i, (icon_type, name, desc) in enumerate(_SIGNIFIERS):
         sx = ctx.layout.content_left + (sig_card_width + sig_card_gap) * i
         # Card
-        page.draw_rect(
-            fitz.Rect(sx, y, sx + sig_card_width, y + sig_card_height),
-            color=ctx.theme.gray,
-            width=0.5,
-        )
+        borders.draw_rect((sx, y, sx + sig_card_width, y + sig_card_height))
         # Icon centered at top
         icon_cx = sx + sig_card_width // 2
         icon_cy = y + sig_padding + 32
@@ -910,10 +938,11 @@ def generate_guide_system(ctx: PageContext, page_idx: int) -> None:
             ctx.renderer.draw_eye(page, icon_cx, icon_cy, 26)
         # Name centered with more space
         name_w = ctx.renderer.get_text_width(name, font_section + 2)
-        ctx.renderer.add_text(page, name, icon_cx - name_w // 2, y + sig_padding + 72, font_section + 2)
+        signifier_runs.append((name, icon_cx - name_w // 2, y + sig_padding + 72, font_section + 2, False))
         # Description centered
         desc_w = ctx.renderer.get_text_width(desc, font_small - 2)
-        ctx.renderer.add_text(page, desc, icon_cx - desc_w // 2, y + sig_padding + 112, font_small - 2)
+        signifier_runs.append((desc, icon_cx - desc_w // 2, y + sig_padding + 112, font_small - 2, False))
+    ctx.renderer.draw_text_lines(page, signifier_runs)
 
     y += sig_card_height + 40
 
@@ -927,11 +956,7 @@ def generate_guide_system(ctx: PageContext, page_idx: int) -> None:
     bottom_margin = 35
     insight_height = ctx.layout.content_bottom - insight_y - bottom_margin
     insight_padding = 28
-    page.draw_rect(
-        fitz.Rect(ctx.layout.content_left, insight_y, ctx.layout.content_right, insight_y + insight_height),
-        color=ctx.theme.gray,
-        width=0.5,
-    )
+    borders.draw_rect((ctx.layout.content_left, insight_y, ctx.layout.content_right, insight_y + insight_height))
     # Title
     ctx.renderer.add_text(page, "The Core Insight", ctx.layout.content_left + insight_padding, insight_y + insight_padding, font_section)
     # Insight text with more breathing room
@@ -944,75 +969,82 @@ def generate_guide_system(ctx: PageContext, page_idx: int) -> None:
         ctx.layout.content_left + insight_padding, insight_y + 65,
         font_small, ctx.layout.content_width - insight_padding * 2, 1.6
     )
+    ctx.renderer.draw_text_lines(page, title_runs)
+    batch.commit()
+
+
+# Set up your logs cards: (name, description, two-column details)
+_LOG_CARDS = (
+    (
+        "Future log",
+        "The Future Log lets you see your future. Store |actions| and |events| that fall outside the current month. It provides an overview of your commitments over time.",
+        None,
+    ),
+    (
+        "Monthly log",
+        "Two pages to reset, reprioritize, and recommit to what you allow into your life every month.",
+        (
+            ("Timeline", "Log events after they've happened. An accurate record of your life."),
+            ("Action Plan", "Organize and prioritize monthly |Tasks.| New tasks and Future Log items."),
+        ),
+    ),
+    (
+        "Weekly log",
+        None,
+        (
+            ("Reflection", "Tidy entries. Acknowledge what moved you toward and away. Migrate relevant |Actions.|"),
+            ("Action plan", "Write only what you can get done this week. Number your top three priorities."),
+        ),
+    ),
+    (
+        "Daily log",
+        "Declutter your mind and stay focused. |Rapid Log| your thoughts as they bubble up. This is your main workspace - the heart of daily practice.",
+        None,
+    ),
+)
 
 
 def generate_guide_set_up_logs(ctx: PageContext, page_idx: int) -> None:
     """Generate Set up your logs page with elegant card-based layout."""
-    page = ctx.renderer.doc[page_idx]
+    page = ctx.renderer.page(page_idx)
+    # Card borders and title rules are collected per style and committed once,
+    # beneath the text
+    batch = StrokeBatch(page)
+    rules = batch.shape(**ctx.renderer.rule_style)
+    borders = batch.shape(**ctx.renderer.border_style)
     font_body = 28
     font_small = 25
     font_section = 25
     line_height = 1.45
     card_padding = 20
 
-    ctx.renderer.add_nav_link(page_idx, "Index", ctx.page_map.main_index, ctx.layout.content_left, ctx.layout.content_top + 5)
-    ctx.renderer.add_text(page, "Set up your logs", ctx.layout.content_left, ctx.layout.content_top + 50, ctx.typography.sizes["header"])
+    _draw_page_header(ctx, page_idx, "Set up your logs", "header")
 
     # Calculate card dimensions to fill available space evenly
-    y_start = ctx.layout.content_top + 120
+    y_start = ctx.layout.setup_cards_top
     available_height = ctx.layout.content_bottom - y_start - 30
     card_gap = 20
     num_cards = 4
     card_height = (available_height - card_gap * (num_cards - 1)) // num_cards
     card_width = ctx.layout.content_width
 
-    # Log definitions with descriptions
-    logs = [
-        {
-            "name": "Future log",
-            "link_target": ctx.page_map.future_log_start,
-            "description": "The Future Log lets you see your future. Store |actions| and |events| that fall outside the current month. It provides an overview of your commitments over time.",
-            "columns": None,
-        },
-        {
-            "name": "Monthly log",
-            "link_target": ctx.page_map.monthly_start,
-            "description": "Two pages to reset, reprioritize, and recommit to what you allow into your life every month.",
-            "columns": [
-                ("Timeline", "Log events after they've happened. An accurate record of your life."),
-                ("Action Plan", "Organize and prioritize monthly |Tasks.| New tasks and Future Log items."),
-            ],
-        },
-        {
-            "name": "Weekly log",
-            "link_target": ctx.page_map.weekly_start,
-            "description": None,
-            "columns": [
-                ("Reflection", "Tidy entries. Acknowledge what moved you toward and away. Migrate relevant |Actions.|"),
-                ("Action plan", "Write only what you can get done this week. Number your top three priorities."),
-            ],
-        },
-        {
-            "name": "Daily log",
-            "link_target": ctx.page_map.daily_start,
-            "description": "Declutter your mind and stay focused. |Rapid Log| your thoughts as they bubble up. This is your main workspace - the heart of daily practice.",
-            "columns": None,
-        },
-    ]
+    # Card destinations, in _LOG_CARDS order
+    link_targets = (
+        ctx.page_map.future_log_start,
+        ctx.page_map.monthly_start,
+        ctx.page_map.weekly_start,
+        ctx.page_map.daily_start,
+    )
 
     y = y_start
-    for log in logs:
+    for (log_name, description, columns), link_target in zip(_LOG_CARDS, link_targets):
         # Draw card border
-        page.draw_rect(
-            fitz.Rect(ctx.layout.content_left, y, ctx.layout.content_left + card_width, y + card_height),
-            color=ctx.theme.gray,
-            width=0.5,
-        )
+        borders.draw_rect((ctx.layout.content_left, y, ctx.layout.content_left + card_width, y + card_height))
 
         # Log name with decorative line
         name_y = y + card_padding
-        ctx.renderer.add_text(page, log["name"], ctx.layout.content_left + card_padding, name_y, ctx.typography.sizes["subheader"])
-        title_w = ctx.renderer.get_text_width(log["name"], ctx.typography.sizes["subheader"])
+        ctx.renderer.add_text(page, log_name, ctx.layout.content_left + card_padding, name_y, ctx.typography.sizes["subheader"])
+        title_w = ctx.renderer.get_text_width(log_name, ctx.typography.sizes["subheader"])
 
         # Get started link at right side
         get_started_text = "Get started"
@@ -1024,28 +1056,24 @@ def generate_guide_set_up_logs(ctx: PageContext, page_idx: int) -> None:
         # Decorative line between title and "Get started"
         line_start_x = ctx.layout.content_left + card_padding + title_w + 15
         line_end_x = get_started_x - 20
-        page.draw_line(
-            fitz.Point(line_start_x, name_y + ctx.typography.sizes["subheader"] * 0.45),
-            fitz.Point(line_end_x, name_y + ctx.typography.sizes["subheader"] * 0.45),
-            color=ctx.theme.gray,
-            width=0.5,
-        )
+        rule_y = name_y + ctx.typography.sizes["subheader"] * 0.45
+        add_line_segments(rules, ((line_start_x, rule_y, line_end_x, rule_y),))
 
         # Link for entire header area
         link_rect = (get_started_x - 5, name_y - 5, ctx.layout.content_right - card_padding, name_y + font_small + 10)
-        ctx.renderer.links.add(page_idx, link_rect, log["link_target"])
+        ctx.renderer.links.add(page_idx, link_rect, link_target)
 
         content_y = name_y + ctx.typography.sizes["subheader"] + 15
 
-        if log["description"]:
+        if description:
             # Single description
             ctx.renderer.draw_rich_text(
-                page, log["description"],
+                page, description,
                 ctx.layout.content_left + card_padding, content_y,
                 font_body, card_width - card_padding * 2, line_height
             )
 
-        if log["columns"]:
+        if columns:
             # Two-column layout
             col_gap = 30
             col_width = (card_width - card_padding * 2 - col_gap) // 2
@@ -1053,10 +1081,10 @@ def generate_guide_set_up_logs(ctx: PageContext, page_idx: int) -> None:
             col2_x = col1_x + col_width + col_gap
 
             # If there's a description, start columns lower
-            if log["description"]:
+            if description:
                 content_y += font_body * line_height * 2 + 10
 
-            for i, (col_title, col_desc) in enumerate(log["columns"]):
+            for i, (col_title, col_desc) in enumerate(columns):
                 col_x = col1_x if i == 0 else col2_x
                 # Column title (italic)
                 ctx.renderer.add_text(page, col_title, col_x, content_y, font_section, italic=True)
@@ -1069,17 +1097,65 @@ def generate_guide_set_up_logs(ctx: PageContext, page_idx: int) -> None:
 
         y += card_height + card_gap
 
+    batch.commit()
+
+
+# T.A.M.E. symbols: stroke width and unit segments (see _STATE_SYMBOL_LINES)
+_TAME_SYMBOL_LINES = {
+    # X mark for Tidy (crossing off)
+    "x": (3, ((-0.4, -0.4, 0.4, 0.4), (-0.4, 0.4, 0.4, -0.4))),
+    # Up and down arrows for Acknowledge (toward/away)
+    "updown": (
+        2.5,
+        (
+            (-0.2, -0.15, -0.2, 0.35),
+            (-0.35, 0.05, -0.2, -0.25),
+            (-0.05, 0.05, -0.2, -0.25),
+            (0.2, -0.35, 0.2, 0.15),
+            (0.05, -0.05, 0.2, 0.25),
+            (0.35, -0.05, 0.2, 0.25),
+        ),
+    ),
+    # Forward arrow for Migrate
+    "arrow": (2.5, ((-0.35, 0.0, 0.35, 0.0), (0.1, -0.3, 0.4, 0.0), (0.1, 0.3, 0.4, 0.0))),
+}
+# Play/action triangle for Enact, closed back to its first corner
+_PLAY_UNIT = ((-0.25, -0.35), (-0.25, 0.35), (0.35, 0.0), (-0.25, -0.35))
+
+
+def _draw_tame_symbol(batch: StrokeBatch, color: tuple, sym_type: str, cx: float, cy: float, size: float = 20) -> None:
+    line_symbol = _TAME_SYMBOL_LINES.get(sym_type)
+    if line_symbol is not None:
+        width, unit_segments = line_symbol
+        add_line_segments(batch.shape(color=color, width=width, closePath=False), _scaled_segments(unit_segments, cx, cy, size))
+    elif sym_type == "play":
+        batch.shape(color=color, width=2.5, closePath=True).draw_polyline([(cx + ux * size, cy + uy * size) for ux, uy in _PLAY_UNIT])
+
+
+# The Practice page: T.A.M.E. cards (letter, name, symbol, description)
+_TAME_CARDS = (
+    ("T", "Tidy", "x", "Cross off completed tasks. Strike through what no longer matters. Clear space before moving forward."),
+    ("A", "Acknowledge", "updown", "Look back at what happened. Mark things that moved you toward or away from your goals."),
+    ("M", "Migrate", "arrow", "Carry forward what still matters. Rewriting confirms your commitment to each task."),
+    ("E", "Enact", "play", "Turn insights into action. Set clear priorities for the next day, week, or month."),
+)
+
 
 def generate_guide_practice(ctx: PageContext, page_idx: int) -> None:
     """Generate The Practice page - T.A.M.E. framework with elegant card-based layout."""
-    page = ctx.renderer.doc[page_idx]
+    page = ctx.renderer.page(page_idx)
+    # Card borders, section rules and T.A.M.E. symbols are collected per style
+    # and committed once, beneath the text
+    batch = StrokeBatch(page)
+    rules = batch.shape(**ctx.renderer.rule_style)
+    borders = batch.shape(**ctx.renderer.border_style)
+    title_runs: list = []
     font_body = 28
     font_section = 25
     font_small = 23
     line_height = 1.45
 
-    ctx.renderer.add_nav_link(page_idx, "Index", ctx.page_map.main_index, ctx.layout.content_left, ctx.layout.content_top + 5)
-    ctx.renderer.add_text(page, "The Practice", ctx.layout.content_left, ctx.layout.content_top + 50, ctx.typography.sizes["header"])
+    _draw_page_header(ctx, page_idx, "The Practice", "header")
 
     y = ctx.layout.content_top + 100
 
@@ -1092,14 +1168,7 @@ def generate_guide_practice(ctx: PageContext, page_idx: int) -> None:
     y += height + 30
 
     # T.A.M.E. Section with decorative title
-    ctx.renderer.add_text(page, "T.A.M.E.", ctx.layout.content_left, y, ctx.typography.sizes["subheader"])
-    title_w = ctx.renderer.get_text_width("T.A.M.E.", ctx.typography.sizes["subheader"])
-    page.draw_line(
-        fitz.Point(ctx.layout.content_left + title_w + 15, y + ctx.typography.sizes["subheader"] * 0.45),
-        fitz.Point(ctx.layout.content_right, y + ctx.typography.sizes["subheader"] * 0.45),
-        color=ctx.theme.gray,
-        width=0.5,
-    )
+    _section_title(ctx, title_runs, rules, "T.A.M.E.", y)
     y += 40
 
     # Card layout - 2x2 grid with larger cards
@@ -1108,13 +1177,6 @@ def generate_guide_practice(ctx: PageContext, page_idx: int) -> None:
     card_height = 165
     card_padding = 22
 
-    cards = [
-        ("T", "Tidy", "x", "Cross off completed tasks. Strike through what no longer matters. Clear space before moving forward."),
-        ("A", "Acknowledge", "updown", "Look back at what happened. Mark things that moved you toward or away from your goals."),
-        ("M", "Migrate", "arrow", "Carry forward what still matters. Rewriting confirms your commitment to each task."),
-        ("E", "Enact", "play", "Turn insights into action. Set clear priorities for the next day, week, or month."),
-    ]
-
     positions = [
         (ctx.layout.content_left, y),
         (ctx.layout.content_left + card_width + card_gap, y),
@@ -1122,44 +1184,10 @@ def generate_guide_practice(ctx: PageContext, page_idx: int) -> None:
         (ctx.layout.content_left + card_width + card_gap, y + card_height + card_gap),
     ]
 
-    def draw_tame_symbol(sym_type: str, cx: float, cy: float, size: int = 20) -> None:
-        if sym_type == "x":
-            # X mark for Tidy (crossing off)
-            hs = size * 0.4
-            page.draw_line(fitz.Point(cx - hs, cy - hs), fitz.Point(cx + hs, cy + hs), color=ctx.theme.black, width=3)
-            page.draw_line(fitz.Point(cx - hs, cy + hs), fitz.Point(cx + hs, cy - hs), color=ctx.theme.black, width=3)
-        elif sym_type == "updown":
-            # Up and down arrows for Acknowledge (toward/away)
-            # Up arrow
-            page.draw_line(fitz.Point(cx - size * 0.2, cy - size * 0.15), fitz.Point(cx - size * 0.2, cy + size * 0.35), color=ctx.theme.black, width=2.5)
-            page.draw_line(fitz.Point(cx - size * 0.35, cy + size * 0.05), fitz.Point(cx - size * 0.2, cy - size * 0.25), color=ctx.theme.black, width=2.5)
-            page.draw_line(fitz.Point(cx - size * 0.05, cy + size * 0.05), fitz.Point(cx - size * 0.2, cy - size * 0.25), color=ctx.theme.black, width=2.5)
-            # Down arrow
-            page.draw_line(fitz.Point(cx + size * 0.2, cy - size * 0.35), fitz.Point(cx + size * 0.2, cy + size * 0.15), color=ctx.theme.black, width=2.5)
-            page.draw_line(fitz.Point(cx + size * 0.05, cy - size * 0.05), fitz.Point(cx + size * 0.2, cy + size * 0.25), color=ctx.theme.black, width=2.5)
-            page.draw_line(fitz.Point(cx + size * 0.35, cy - size * 0.05), fitz.Point(cx + size * 0.2, cy + size * 0.25), color=ctx.theme.black, width=2.5)
-        elif sym_type == "arrow":
-            # Forward arrow for Migrate
-            page.draw_line(fitz.Point(cx - size * 0.35, cy), fitz.Point(cx + size * 0.35, cy), color=ctx.theme.black, width=2.5)
-            page.draw_line(fitz.Point(cx + size * 0.1, cy - size * 0.3), fitz.Point(cx + size * 0.4, cy), color=ctx.theme.black, width=2.5)
-            page.draw_line(fitz.Point(cx + size * 0.1, cy + size * 0.3), fitz.Point(cx + size * 0.4, cy), color=ctx.theme.black, width=2.5)
-        elif sym_type == "play":
-            # Play/action triangle for Enact
-            pts = [
-                fitz.Point(cx - size * 0.25, cy - size * 0.35),
-                fitz.Point(cx - size * 0.25, cy + size * 0.35),
-                fitz.Point(cx + size * 0.35, cy),
-            ]
-            page.draw_polyline(pts + [pts[0]], color=ctx.theme.black, width=2.5, closePath=True)
-
-    for i, (letter, name, sym_type, desc) in enumerate(cards):
+    for i, (letter, name, sym_type, desc) in enumerate(_TAME_CARDS):
         cx, cy = positions[i]
         # Card border - subtle gray like The System page
-        page.draw_rect(
-            fitz.Rect(cx, cy, cx + card_width, cy + card_height),
-            color=ctx.theme.gray,
-            width=0.5,
-        )
+        borders.draw_rect((cx, cy, cx + card_width, cy + card_height))
         # Large letter
         letter_x = cx + card_padding
         letter_y = cy + card_padding
@@ -1167,7 +1195,7 @@ def generate_guide_practice(ctx: PageContext, page_idx: int) -> None:
         # Symbol after letter
         sym_x = letter_x + 55
         sym_y = letter_y + 26
-        draw_tame_symbol(sym_type, sym_x, sym_y, 22)
+        _draw_tame_symbol(batch, ctx.theme.black, sym_type, sym_x, sym_y, 22)
         # Name - adjusted position
         ctx.renderer.add_text(page, name, cx + card_padding + 90, letter_y + 8, font_section + 2)
         # Description - multi-line
@@ -1176,14 +1204,7 @@ def generate_guide_practice(ctx: PageContext, page_idx: int) -> None:
     y = positions[2][1] + card_height + 40
 
     # Reflection Rhythm section with decorative title
-    ctx.renderer.add_text(page, "Reflection Rhythm", ctx.layout.content_left, y, ctx.typography.sizes["subheader"])
-    title_w = ctx.renderer.get_text_width("Reflection Rhythm", ctx.typography.sizes["subheader"])
-    page.draw_line(
-        fitz.Point(ctx.layout.content_left + title_w + 15, y + ctx.typography.sizes["subheader"] * 0.45),
-        fitz.Point(ctx.layout.content_right, y + ctx.typography.sizes["subheader"] * 0.45),
-        color=ctx.theme.gray,
-        width=0.5,
-    )
+    _section_title(ctx, title_runs, rules, "Reflection Rhythm", y)
     y += 40
 
     font_rhythm = 25
@@ -1192,149 +1213,138 @@ def generate_guide_practice(ctx: PageContext, page_idx: int) -> None:
     indent = 20
     detail_indent = 40
 
-    # Daily reflection
-    ctx.renderer.draw_rich_text(page, "|Daily| - Every evening on Daily Log page", ctx.layout.content_left + indent, y, font_rhythm, ctx.layout.content_width - 60, rhythm_line_height)
-    y += font_rhythm * rhythm_line_height + 4
-    ctx.renderer.add_text(page, "Review today's entries. Cross off completed tasks.", ctx.layout.content_left + detail_indent, y, font_detail)
-    y += font_detail * rhythm_line_height
-    ctx.renderer.add_text(page, "Migrate unfinished items to tomorrow or Future Log.", ctx.layout.content_left + detail_indent, y, font_detail)
-    y += font_detail * rhythm_line_height
-    ctx.renderer.add_text(page, "Set 1-3 priorities for tomorrow.", ctx.layout.content_left + detail_indent, y, font_detail)
-    y += font_detail * rhythm_line_height + 15
-
-    # Weekly reflection
-    ctx.renderer.draw_rich_text(page, "|Weekly| - Sunday on Weekly Reflection page", ctx.layout.content_left + indent, y, font_rhythm, ctx.layout.content_width - 60, rhythm_line_height)
-    y += font_rhythm * rhythm_line_height + 4
-    ctx.renderer.add_text(page, "Review Weekly Action plan: what got done, what didn't.", ctx.layout.content_left + detail_indent, y, font_detail)
-    y += font_detail * rhythm_line_height
-    ctx.renderer.add_text(page, "Acknowledge progress toward/away from goals.", ctx.layout.content_left + detail_indent, y, font_detail)
-    y += font_detail * rhythm_line_height
-    ctx.renderer.add_text(page, "Migrate remaining tasks. Set next week's focus.", ctx.layout.content_left + detail_indent, y, font_detail)
-    y += font_detail * rhythm_line_height + 15
-
-    # Monthly reflection
-    ctx.renderer.draw_rich_text(page, "|Monthly| - Last day on Monthly Timeline page", ctx.layout.content_left + indent, y, font_rhythm, ctx.layout.content_width - 60, rhythm_line_height)
-    y += font_rhythm * rhythm_line_height + 4
-    ctx.renderer.add_text(page, "Review Monthly Timeline: events, patterns, surprises.", ctx.layout.content_left + detail_indent, y, font_detail)
-    y += font_detail * rhythm_line_height
-    ctx.renderer.add_text(page, "Check Intention and Goals pages. Are you on track?", ctx.layout.content_left + detail_indent, y, font_detail)
-    y += font_detail * rhythm_line_height
-    ctx.renderer.add_text(page, "Migrate incomplete items. Set next month's direction.", ctx.layout.content_left + detail_indent, y, font_detail)
-    y += font_detail * rhythm_line_height + 20
+    rhythm_blocks = [
+        (
+            "|Daily| - Every evening on Daily Log page",
+            (
+                "Review today's entries. Cross off completed tasks.",
+                "Migrate unfinished items to tomorrow or Future Log.",
+                "Set 1-3 priorities for tomorrow.",
+            ),
+        ),
+        (
+            "|Weekly| - Sunday on Weekly Reflection page",
+            (
+                "Review Weekly Action plan: what got done, what didn't.",
+                "Acknowledge progress toward/away from goals.",
+                "Migrate remaining tasks. Set next week's focus.",
+            ),
+        ),
+        (
+            "|Monthly| - Last day on Monthly Timeline page",
+            (
+                "Review Monthly Timeline: events, patterns, surprises.",
+                "Check Intention and Goals pages. Are you on track?",
+                "Migrate incomplete items. Set next month's direction.",
+            ),
+        ),
+    ]
+
+    # The whole section is laid out first and written as one text object
+    runs = []
+    for i, (heading, details) in enumerate(rhythm_blocks):
+        if i:
+            y += 15
+        heading_runs, _ = ctx.renderer.layout_rich_text(heading, ctx.layout.content_left + indent, y, font_rhythm, ctx.layout.content_width - 60, rhythm_line_height)
+        runs.extend(heading_runs)
+        y += font_rhythm * rhythm_line_height + 4
+        for detail in details:
+            runs.append((detail, ctx.layout.content_left + detail_indent, y, font_detail, False))
+            y += font_detail * rhythm_line_height
+    y += 20
 
     # Tip
-    ctx.renderer.add_text(page, "Tip: On week/month end, Daily Log shows a Reflection link.", ctx.layout.content_left + indent, y, font_detail, italic=True)
+    runs.append(("Tip: On week/month end, Daily Log shows a Reflection link.", ctx.layout.content_left + indent, y, font_detail, True))
+    ctx.renderer.draw_text_lines(page, runs)
+    ctx.renderer.draw_text_lines(page, title_runs)
+    batch.commit()
+
+
+def _draw_page_frame(
+    ctx: PageContext,
+    page_idx: int,
+    title: str,
+    footer_key: str,
+    title_size: str = "title_page",
+    grid_top: float | None = None,
+) -> fitz.Page:
+    """Draw the header, the dot grid down to the footer, and the footer of a section page."""
+    page = ctx.renderer.page(page_idx)
+    _draw_page_header(ctx, page_idx, title, title_size)
+    ctx.renderer.draw_dot_grid(page, ctx.layout.grid_top if grid_top is None else grid_top, ctx.layout.grid_bottom)
+    ctx.renderer.draw_footer_section(page, FOOTER_TEXTS[footer_key])
+    return page
 
 
 def generate_guide_intention(ctx: PageContext, page_idx: int) -> None:
     """Generate Intention page - minimalist design with maximum writing space."""
-    page = ctx.renderer.doc[page_idx]
-
-    ctx.renderer.add_nav_link(page_idx, "Index", ctx.page_map.main_index, ctx.layout.content_left, ctx.layout.content_top + 5)
-    ctx.renderer.add_text(page, "Intention", ctx.layout.content_left, ctx.layout.content_top + 50, ctx.typography.sizes["header"])
-
-    # Maximize dot grid space - extend to just above footer
-    grid_top = ctx.layout.content_top + 100
-    grid_bottom = ctx.layout.target_height - 70  # Leave space for footer
-    ctx.renderer.draw_dot_grid(page, grid_top, grid_bottom)
-
-    # Unified footer section
-    ctx.renderer.draw_footer_section(page, FOOTER_TEXTS["intention"])
+    # Maximize dot grid space - start right under the title
+    _draw_page_frame(ctx, page_idx, "Intention", "intention", "header", grid_top=ctx.layout.guide_grid_top)
 
 
 def generate_guide_goals(ctx: PageContext, page_idx: int) -> None:
     """Generate Goals page - minimalist design with maximum writing space."""
-    page = ctx.renderer.doc[page_idx]
-
-    ctx.renderer.add_nav_link(page_idx, "Index", ctx.page_map.main_index, ctx.layout.content_left, ctx.layout.content_top + 5)
-    ctx.renderer.add_text(page, "Goals", ctx.layout.content_left, ctx.layout.content_top + 50, ctx.typography.sizes["header"])
-
-    # Maximize dot grid space - extend to just above footer
-    grid_top = ctx.layout.content_top + 100
-    grid_bottom = ctx.layout.target_height - 70  # Leave space for footer
-    ctx.renderer.draw_dot_grid(page, grid_top, grid_bottom)
-
-    # Unified footer section
-    ctx.renderer.draw_footer_section(page, FOOTER_TEXTS["goals"])
+    # Maximize dot grid space - start right under the title
+    _draw_page_frame(ctx, page_idx, "Goals", "goals", "header", grid_top=ctx.layout.guide_grid_top)
 
 
 def generate_future_log(ctx: PageContext, page_idx: int, quarter: int) -> None:
-    page = ctx.renderer.doc[page_idx]
-
-    ctx.renderer.add_nav_link(page_idx, "Index", ctx.page_map.main_index, ctx.layout.content_left, ctx.layout.content_top + 5)
-    ctx.renderer.add_text(page, "Future Log", ctx.layout.content_left, ctx.layout.content_top + 50, ctx.typography.sizes["title_page"])
+    page = _draw_page_frame(ctx, page_idx, "Future Log", "future_log")
 
     start_idx = (quarter - 1) * 3
     months = ctx.calendar.months[start_idx:start_idx + 3]
 
-    # Extend dot grid to just above footer (footer starts at target_height - 55)
-    grid_start_y = ctx.layout.content_top + 115
-    grid_end_y = ctx.layout.target_height - 70
-
-    ctx.renderer.draw_dot_grid(page, grid_start_y, grid_end_y)
+    grid_start_y = ctx.layout.grid_top
+    grid_end_y = ctx.layout.grid_bottom
 
     # Distribute available space evenly among 3 months
     available_height = grid_end_y - grid_start_y
     month_height = available_height // 3
 
+    # The month rules share one style and are stroked as a single path
+    rules = []
     for i, month in enumerate(months):
         my = grid_start_y + i * month_height
         ctx.renderer.add_text(page, month.name, ctx.layout.content_left, my, ctx.typography.sizes["body"])
-        page.draw_line(
-            fitz.Point(ctx.layout.content_left, my + 45),
-            fitz.Point(ctx.layout.content_right, my + 45),
-            color=ctx.theme.black,
-            width=0.5,
-        )
-
-    ctx.renderer.draw_footer_section(page, FOOTER_TEXTS["future_log"])
+        rules.append((ctx.layout.content_left, my + 45, ctx.layout.content_right, my + 45))
+    shape = page.new_shape()
+    add_line_segments(shape, rules)
+    shape.finish(color=ctx.theme.black, width=0.5, closePath=False)
+    shape.commit()
 
 
 def generate_monthly_timeline(ctx: PageContext, page_idx: int, month_idx: int) -> None:
-    page = ctx.renderer.doc[page_idx]
     month = ctx.calendar.months[month_idx]
+    page = _draw_page_frame(ctx, page_idx, month.name, "monthly_timeline")
 
-    ctx.renderer.add_nav_link(page_idx, "Index", ctx.page_map.main_index, ctx.layout.content_left, ctx.layout.content_top + 5)
-    ctx.renderer.add_text(page, month.name, ctx.layout.content_left, ctx.layout.content_top + 50, ctx.typography.sizes["title_page"])
-
-    # Extend dot grid to just above footer
-    grid_start_y = ctx.layout.content_top + 115
-    grid_end_y = ctx.layout.target_height - 70
-
-    ctx.renderer.draw_dot_grid(page, grid_start_y, grid_end_y)
+    grid_start_y = ctx.layout.grid_top
+    grid_end_y = ctx.layout.grid_bottom
 
     # Distribute day numbers evenly in available height
     available_height = grid_end_y - grid_start_y
     day_height = available_height / month.days
 
+    # Day numbers and their links are collected in one pass, then written as
+    # one text object and registered together; each day's day-of-year is an
+    # offset from the month's first day
+    day_size = ctx.typography.sizes["day_number"]
+    half_day_size = day_size / 2
+    left = ctx.layout.content_left
+    link_left, link_right = left - 5, left + 35
+    link_rects = []
+    day_runs = []
     for day in range(1, month.days + 1):
-        day_y = grid_start_y + (day - 1) * day_height + ctx.typography.sizes["day_number"] / 2
-        ctx.renderer.add_text(page, str(day), ctx.layout.content_left, day_y, ctx.typography.sizes["day_number"])
-
-        day_of_year = ctx.calendar.day_of_year(month_idx, day)
-        dest_page = ctx.page_map.daily_page(day_of_year)
-        link_rect = (
-            ctx.layout.content_left - 5,
-            day_y - 5,
-            ctx.layout.content_left + 35,
-            day_y + ctx.typography.sizes["day_number"] + 5,
-        )
-        ctx.renderer.links.add(page_idx, link_rect, dest_page)
-
-    ctx.renderer.draw_footer_section(page, FOOTER_TEXTS["monthly_timeline"])
+        day_y = grid_start_y + (day - 1) * day_height + half_day_size
+        day_runs.append((str(day), left, day_y, day_size, False))
+        link_rects.append((link_left, day_y - 5, link_right, day_y + day_size + 5))
+    first_day = month.start_day_of_year
+    dest_pages = ctx.page_map.daily_pages(first_day, first_day + month.days)
+    ctx.renderer.links.add_many(page_idx, link_rects, dest_pages)
+    ctx.renderer.draw_text_lines(page, day_runs)
 
 
 def generate_monthly_action_plan(ctx: PageContext, page_idx: int, month_idx: int) -> None:
-    page = ctx.renderer.doc[page_idx]
-    month = ctx.calendar.months[month_idx]
-
-    ctx.renderer.add_nav_link(page_idx, "Index", ctx.page_map.main_index, ctx.layout.content_left, ctx.layout.content_top + 5)
-    ctx.renderer.add_text(page, month.name, ctx.layout.content_left, ctx.layout.content_top + 50, ctx.typography.sizes["title_page"])
-
-    # Extend dot grid to just above footer
-    ctx.renderer.draw_dot_grid(page, ctx.layout.content_top + 115, ctx.layout.target_height - 70)
-
-    ctx.renderer.draw_footer_section(page, FOOTER_TEXTS["monthly_action"])
+    _draw_page_frame(ctx, page_idx, ctx.calendar.months[month_idx].name, "monthly_action")
 
 
 def _draw_clickable_week_date_range(ctx: PageContext, page_idx: int, week_num: int, x: float, y: float, font_size: float) -> None:
@@ -1342,9 +1352,8 @@ def _draw_clickable_week_date_range(ctx: PageContext, page_idx: int, week_num: i
 
     If the week spans across years, clip dates to the current year boundaries.
     """
-    import calendar as cal_module
     from datetime import date as date_type
-    page = ctx.renderer.doc[page_idx]
+    page = ctx.renderer.page(page_idx)
     start_date, end_date = ctx.calendar.week_date_range(week_num)
 
     # Clip dates to current year boundaries
@@ -1355,8 +1364,8 @@ def _draw_clickable_week_date_range(ctx: PageContext, page_idx: int, week_num: i
         end_date = date_type(year, 12, 31)  # Dec 31 of current year
 
     # Format: "Jan 1" - "Jan 4" with clickable dates
-    start_label = f"{cal_module.month_abbr[start_date.month]} {start_date.day}"
-    end_label = f"{cal_module.month_abbr[end_date.month]} {end_date.day}"
+    start_label = f"{ctx.calendar.months[start_date.month - 1].abbrev} {start_date.day}"
+    end_label = f"{ctx.calendar.months[end_date.month - 1].abbrev} {end_date.day}"
     separator = " - "
 
     current_x = x
@@ -1378,47 +1387,34 @@ def _draw_clickable_week_date_range(ctx: PageContext, page_idx: int, week_num: i
 
 
 def generate_weekly_action_plan(ctx: PageContext, page_idx: int, week_idx: int) -> None:
-    page = ctx.renderer.doc[page_idx]
     week_num = week_idx + 1
 
-    ctx.renderer.add_nav_link(page_idx, "Index", ctx.page_map.main_index, ctx.layout.content_left, ctx.layout.content_top + 5)
-    ctx.renderer.add_text(page, f"W{week_num} Action plan", ctx.layout.content_left, ctx.layout.content_top + 50, ctx.typography.sizes["title_page"])
+    _draw_page_frame(ctx, page_idx, f"W{week_num} Action plan", "weekly_action")
 
     # Auto-fill date range from calendar with clickable dates
-    _draw_clickable_week_date_range(ctx, page_idx, week_num, ctx.layout.content_right - 180, ctx.layout.content_top + 55, 22)
-
-    # Extend dot grid to just above footer
-    ctx.renderer.draw_dot_grid(page, ctx.layout.content_top + 115, ctx.layout.target_height - 70)
-
-    ctx.renderer.draw_footer_section(page, FOOTER_TEXTS["weekly_action"])
+    _draw_clickable_week_date_range(ctx, page_idx, week_num, ctx.layout.content_right - 180, ctx.layout.week_range_y, 22)
 
 
 def generate_weekly_reflection(ctx: PageContext, page_idx: int, week_idx: int) -> None:
-    page = ctx.renderer.doc[page_idx]
     week_num = week_idx + 1
 
-    ctx.renderer.add_nav_link(page_idx, "Index", ctx.page_map.main_index, ctx.layout.content_left, ctx.layout.content_top + 5)
-    ctx.renderer.add_text(page, f"W{week_num} Reflection", ctx.layout.content_left, ctx.layout.content_top + 50, ctx.typography.sizes["title_page"])
+    _draw_page_frame(ctx, page_idx, f"W{week_num} Reflection", "weekly_reflection")
 
     # Auto-fill date range from calendar with clickable dates
-    _draw_clickable_week_date_range(ctx, page_idx, week_num, ctx.layout.content_right - 180, ctx.layout.content_top + 55, 22)
-
-    # Extend dot grid to just above footer
-    ctx.renderer.draw_dot_grid(page, ctx.layout.content_top + 115, ctx.layout.target_height - 70)
-
-    ctx.renderer.draw_footer_section(page, FOOTER_TEXTS["weekly_reflection"])
+    _draw_clickable_week_date_range(ctx, page_idx, week_num, ctx.layout.content_right - 180, ctx.layout.week_range_y, 22)
 
 
 def generate_daily_log(ctx: PageContext, page_idx: int, month_idx: int, day: int) -> None:
-    page = ctx.renderer.doc[page_idx]
+    page = ctx.renderer.page(page_idx)
 
     # Breadcrumb navigation: ← Index / January / W1
     # Larger spacing for touch-friendly operation on reMarkable
-    nav_y = ctx.layout.content_top + 5
+    nav_y = ctx.layout.nav_y
     nav_font = ctx.typography.sizes["nav"]
     sep = "/"
     sep_color = ctx.theme.gray
     touch_gap = 30  # Extra spacing between elements for finger tapping
+    sep_advance = ctx.renderer.get_text_width(sep, nav_font) + touch_gap
 
     # ← Index (with arrow, clickable)
     ctx.renderer.add_nav_link(page_idx, "Index", ctx.page_map.year_index, ctx.layout.content_left, nav_y)
@@ -1430,7 +1426,7 @@ def generate_daily_log(ctx: PageContext, page_idx: int, month_idx: int, day: int
 
     # Separator
     ctx.renderer.add_text(page, sep, x, nav_y, nav_font, sep_color)
-    x += ctx.renderer.get_text_width(sep, nav_font) + touch_gap
+    x += sep_advance
 
     # Check for reflection reminders first (affects breadcrumb structure)
     is_last_of_week = ctx.calendar.is_last_day_of_week(month_idx, day)
@@ -1452,13 +1448,13 @@ def generate_daily_log(ctx: PageContext, page_idx: int, month_idx: int, day: int
     # Monthly Reflection link (placed right after month, if month end)
     if is_last_of_month:
         ctx.renderer.add_text(page, sep, x, nav_y, nav_font, sep_color)
-        x += ctx.renderer.get_text_width(sep, nav_font) + touch_gap
+        x += sep_advance
         ctx.renderer.add_nav_link(page_idx, "Reflection", monthly_page, x, nav_y, with_arrow=False)
         x += ctx.renderer.get_text_width("Reflection", nav_font) + touch_gap
 
     # Separator before week
     ctx.renderer.add_text(page, sep, x, nav_y, nav_font, sep_color)
-    x += ctx.renderer.get_text_width(sep, nav_font) + touch_gap
+    x += sep_advance
 
     # Week (clickable, no arrow)
     week_num = ctx.calendar.week_of_date(month_idx, day)
@@ -1471,30 +1467,29 @@ def generate_daily_log(ctx: PageContext, page_idx: int, month_idx: int, day: int
     if is_last_of_week:
         weekly_reflection_page = ctx.page_map.weekly_reflection(week_num - 1)
         ctx.renderer.add_text(page, sep, x, nav_y, nav_font, sep_color)
-        x += ctx.renderer.get_text_width(sep, nav_font) + touch_gap
+        x += sep_advance
         ctx.renderer.add_nav_link(page_idx, "Reflection", weekly_reflection_page, x, nav_y, with_arrow=False)
 
     # Include day-of-week abbreviation: "Mon, Jan 15"
-    day_abbrev = ctx.calendar.day_of_week_abbrev(month_idx, day)
-    date_label = f"{day_abbrev}, {ctx.calendar.date_label(month_idx, day)}"
-    ctx.renderer.add_text(page, date_label, ctx.layout.content_left, ctx.layout.content_top + 70, ctx.typography.sizes["title_page"])
+    ctx.renderer.add_text(page, ctx.calendar.day_heading(month_idx, day), ctx.layout.content_left, ctx.layout.day_title_y, ctx.typography.sizes["title_page"])
 
     # Extend dot grid to just above footer
-    ctx.renderer.draw_dot_grid(page, ctx.layout.content_top + 145, ctx.layout.target_height - 70)
+    ctx.renderer.draw_dot_grid(page, ctx.layout.day_grid_top, ctx.layout.grid_bottom)
 
     ctx.renderer.draw_footer_section(page, FOOTER_TEXTS[footer_key])
 
 
 def generate_daily_log_continuation(ctx: PageContext, page_idx: int, month_idx: int, day: int) -> None:
-    page = ctx.renderer.doc[page_idx]
+    page = ctx.renderer.page(page_idx)
 
     # Breadcrumb navigation: ← Index / January / W1
     # Larger spacing for touch-friendly operation on reMarkable
-    nav_y = ctx.layout.content_top + 5
+    nav_y = ctx.layout.nav_y
     nav_font = ctx.typography.sizes["nav"]
     sep = "/"
     sep_color = ctx.theme.gray
     touch_gap = 30  # Extra spacing between elements for finger tapping
+    sep_advance = ctx.renderer.get_text_width(sep, nav_font) + touch_gap
 
     # ← Index (with arrow, clickable)
     ctx.renderer.add_nav_link(page_idx, "Index", ctx.page_map.year_index, ctx.layout.content_left, nav_y)
@@ -1506,7 +1501,7 @@ def generate_daily_log_continuation(ctx: PageContext, page_idx: int, month_idx:
 
     # Separator
     ctx.renderer.add_text(page, sep, x, nav_y, nav_font, sep_color)
-    x += ctx.renderer.get_text_width(sep, nav_font) + touch_gap
+    x += sep_advance
 
     # Month name (clickable, no arrow)
     month_name = ctx.calendar.months[month_idx].name
@@ -1516,7 +1511,7 @@ def generate_daily_log_continuation(ctx: PageContext, page_idx: int, month_idx:
 
     # Separator
     ctx.renderer.add_text(page, sep, x, nav_y, nav_font, sep_color)
-    x += ctx.renderer.get_text_width(sep, nav_font) + touch_gap
+    x += sep_advance
 
     # Week (clickable, no arrow)
     week_num = ctx.calendar.week_of_date(month_idx, day)
@@ -1525,16 +1520,14 @@ def generate_daily_log_continuation(ctx: PageContext, page_idx: int, month_idx:
     ctx.renderer.add_nav_link(page_idx, week_label, week_page, x, nav_y, with_arrow=False)
 
     # Include day-of-week abbreviation: "Mon, Jan 15"
-    day_abbrev = ctx.calendar.day_of_week_abbrev(month_idx, day)
-    date_label = f"{day_abbrev}, {ctx.calendar.date_label(month_idx, day)}"
-    ctx.renderer.add_text(page, date_label, ctx.layout.content_left, ctx.layout.content_top + 70, ctx.typography.sizes["title_page"])
+    ctx.renderer.add_text(page, ctx.calendar.day_heading(month_idx, day), ctx.layout.content_left, ctx.layout.day_title_y, ctx.typography.sizes["title_page"])
 
     # Continuation pages have no footer, extend grid closer to bottom
-    ctx.renderer.draw_dot_grid(page, ctx.layout.content_top + 145, ctx.layout.target_height - 50)
+    ctx.renderer.draw_dot_grid(page, ctx.layout.day_grid_top, ctx.layout.continuation_grid_bottom)
 
 
 def generate_collection_page(ctx: PageContext, page_idx: int, index_page_idx: int) -> None:
-    page = ctx.renderer.doc[page_idx]
+    page = ctx.renderer.page(page_idx)
 
-    ctx.renderer.add_nav_link(page_idx, "Index", index_page_idx, ctx.layout.content_left, ctx.layout.content_top + 5)
-    ctx.renderer.draw_dot_grid(page, ctx.layout.content_top + 50, ctx.layout.content_bottom - 30)
+    ctx.renderer.add_nav_link(page_idx, "Index", index_page_idx, ctx.layout.content_left, ctx.layout.nav_y)
+    ctx.renderer.draw_dot_grid(page, ctx.layout.collection_grid_top, ctx.layout.collection_grid_bottom)
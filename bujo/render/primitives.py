@@ -1,16 +1,63 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from types import MappingProxyType
+from typing import Callable, Hashable, Iterable, Iterator, Optional, Tuple
 
 import fitz
 
 from ..config import Layout, Theme, Typography
-from ..link_manager import LinkManager
+from ..link_manager import LinkManager, _pdf_number
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=None)
+def _parse_rich_text(text: str) -> Tuple[Tuple[str, bool], ...]:
+    """Split ``|italic|`` markup into (word, is_italic) pairs.
+
+    Rich text on the pages comes from fixed literals, so each string is parsed once.
+    """
+    words_with_style = []
+    for i, part in enumerate(text.split("|")):
+        is_italic = (i % 2 == 1)
+        for word in part.split():
+            words_with_style.append((word, is_italic))
+    return tuple(words_with_style)
+
+
+@lru_cache(maxsize=None)
+def _strip_rich_markers(text: str) -> str:
+    return text.replace("|", "")
+
+
+def _check_raw_path_target(shape: fitz.Shape) -> None:
+    # The raw path writers below bypass Shape.draw_* and rely on two Shape
+    # internals: ``draw_cont`` (the pending path operators, emitted by finish)
+    # and ``last_point`` (the current point draw_* continue from). They also
+    # map top-left page coordinates to PDF space with a plain ``height - y``
+    # flip, which only holds on unrotated pages.
+    if shape.page.rotation:
+        raise ValueError(f"raw path output requires an unrotated page, got rotation {shape.page.rotation}")
+
+
+def add_line_segments(shape: fitz.Shape, segments: Iterable[Tuple[float, float, float, float]]) -> None:
+    """Append (x0, y0, x1, y1) line segments to ``shape`` as raw PDF path operators.
+
+    Equivalent to one ``shape.draw_line`` per segment, without building and
+    transforming Point objects for every endpoint.
+    """
+    _check_raw_path_target(shape)
+    height = shape.height
+    shape.draw_cont += "".join(
+        f"{_pdf_number(x0)} {_pdf_number(height - y0)} m\n{_pdf_number(x1)} {_pdf_number(height - y1)} l\n"
+        for x0, y0, x1, y1 in segments
+    )
+    shape.last_point = None
+
+
+@dataclass(frozen=True, slots=True)
 class FontSpec:
     name: str
     font: fitz.Font
@@ -24,7 +71,12 @@ class FontManager:
         self._resolved = False
         self._regular: Optional[FontSpec] = None
         self._italic: Optional[FontSpec] = None
+        # (regular, italic), indexed by the ``italic`` flag once resolved
+        self._specs: tuple[FontSpec, FontSpec] | None = None
         self._missing: list[str] = []
+        # Page text comes from a small fixed vocabulary (day and week numbers,
+        # nav labels, guide words), so measurements are memoized per string
+        self._text_lengths: dict[tuple[str, float, bool], float] = {}
 
     def resolve(self) -> None:
         if self._resolved:
@@ -49,6 +101,7 @@ class FontManager:
             italic_font = fitz.Font(fontname=self.typography.fallback_italic)
             self._italic = FontSpec(self.typography.fallback_italic, italic_font, None)
 
+        self._specs = (self._regular, self._italic)
         self._resolved = True
 
     def missing_fonts(self) -> list[str]:
@@ -56,18 +109,47 @@ class FontManager:
         return list(self._missing)
 
     def font(self, italic: bool = False) -> FontSpec:
-        self.resolve()
-        return self._italic if italic else self._regular  # type: ignore[return-value]
-
-    def register_page(self, page: fitz.Page) -> None:
-        self.resolve()
-        for spec in (self._regular, self._italic):
-            if spec and spec.file is not None:
-                page.insert_font(fontname=spec.name, fontfile=str(spec.file))
+        # Looked up for every text run, so the resolved pair is indexed directly
+        if not self._resolved:
+            self.resolve()
+        return self._specs[italic]  # type: ignore[index]
 
     def text_length(self, text: str, font_size: float, italic: bool = False) -> float:
-        spec = self.font(italic=italic)
-        return spec.font.text_length(text, fontsize=font_size)
+        key = (text, font_size, italic)
+        length = self._text_lengths.get(key)
+        if length is None:
+            spec = self.font(italic=italic)
+            length = self._text_lengths[key] = spec.font.text_length(text, fontsize=font_size)
+        return length
+
+
+class StrokeBatch:
+    """Collects paths into one shape per drawing style, finished and committed together.
+
+    Styles are the keyword arguments of ``fitz.Shape.finish``; paths drawn with
+    the same style share a single path object in the page content stream.
+    """
+
+    def __init__(self, page: fitz.Page) -> None:
+        self.page = page
+        self._shapes: dict[tuple, fitz.Shape] = {}
+
+    def shape(self, **style) -> fitz.Shape:
+        key = tuple(sorted(style.items()))
+        shape = self._shapes.get(key)
+        if shape is None:
+            shape = self._shapes[key] = self.page.new_shape()
+        return shape
+
+    def commit(self) -> None:
+        """Finish and commit every shape on top of the content drawn so far.
+
+        Inside ``Renderer.batch`` the page's queued text is still written above them.
+        """
+        for style, shape in self._shapes.items():
+            shape.finish(**dict(style))
+            shape.commit()
+        self._shapes.clear()
 
 
 class Renderer:
@@ -86,6 +168,56 @@ class Renderer:
         self.typography = typography
         self.font_manager = font_manager
         self.links = links
+        # Shared stroke presets, as Shape.finish keyword sets: hairline rules
+        # and card borders, and the dashed connector between diagram symbols
+        self.rule_style = MappingProxyType({"color": theme.gray, "width": 0.5, "closePath": False})
+        self.border_style = MappingProxyType({"color": theme.gray, "width": 0.5})
+        self.connector_style = MappingProxyType({"color": theme.gray, "width": 1, "dashes": "[4 4]"})
+        # Generators and the nav helpers they call work on one page at a time,
+        # so the most recently resolved page is kept for the following lookups
+        self._current_page: tuple[int, fitz.Page] | None = None
+        # Form XObjects stamped so far, as (key, page width, page height) ->
+        # (resource name, form xref)
+        self._forms: dict[Hashable, tuple[str, int]] = {}
+        # Pages whose existing content has been wrapped in a balanced q/Q pair
+        # before their first stamp
+        self._wrapped_pages: set[int] = set()
+        # Page whose text is being queued by batch(), with its per-color text
+        # writers
+        self._text_batch: tuple[fitz.Page, dict[tuple, fitz.TextWriter]] | None = None
+
+    def page(self, page_idx: int) -> fitz.Page:
+        current = self._current_page
+        if current is not None and current[0] == page_idx:
+            return current[1]
+        page = self.doc[page_idx]
+        self._current_page = (page_idx, page)
+        return page
+
+    @contextmanager
+    def batch(self, page_idx: int) -> Iterator[fitz.Page]:
+        """Queue the text written to one page and write it out together on exit.
+
+        ``add_text`` and ``draw_text_lines`` append to one text object per color
+        instead of adding a content stream per call. The text is written after
+        everything else drawn in the block, so it must not be covered by later
+        drawings.
+        """
+        page = self.page(page_idx)
+        with self._queued_text(page):
+            yield page
+
+    @contextmanager
+    def _queued_text(self, page: fitz.Page) -> Iterator[None]:
+        writers: dict[tuple, fitz.TextWriter] = {}
+        previous = self._text_batch
+        self._text_batch = (page, writers)
+        try:
+            yield
+            for color, writer in writers.items():
+                writer.write_text(page, color=color)
+        finally:
+            self._text_batch = previous
 
     def add_text(
         self,
@@ -97,46 +229,58 @@ class Renderer:
         color: Tuple = None,
         italic: bool = False,
     ) -> None:
-        if color is None:
-            color = self.theme.black
-        self.font_manager.register_page(page)
-        spec = self.font_manager.font(italic=italic)
-        page.insert_text(
-            fitz.Point(x, y + font_size),
-            text,
-            fontsize=font_size,
-            fontname=spec.name,
-            fontfile=str(spec.file) if spec.file is not None else None,
-            color=color,
-        )
+        self.draw_text_lines(page, ((text, x, y, font_size, italic),), color)
 
     def get_text_width(self, text: str, font_size: float, italic: bool = False) -> float:
         return self.font_manager.text_length(text, font_size, italic=italic)
 
-    def draw_rich_text(
+    def draw_text_lines(
         self,
         page: fitz.Page,
+        runs: Iterable[Tuple[str, float, float, float, bool]],
+        color: Tuple = None,
+    ) -> None:
+        """Queue (text, x, y, font_size, italic) runs on the open ``batch`` of ``page``.
+
+        Positions follow ``add_text``: ``y`` is the top of the line, not the baseline.
+        Outside a batch the runs are written out at once, as a batch of their own.
+        """
+        batch = self._text_batch
+        if batch is None or batch[0] is not page:
+            with self._queued_text(page):
+                self.draw_text_lines(page, runs, color)
+            return
+        if color is None:
+            color = self.theme.black
+        writer = batch[1].get(color)
+        if writer is None:
+            writer = batch[1][color] = fitz.TextWriter(page.rect)
+        fonts = (self.font_manager.font().font, self.font_manager.font(italic=True).font)
+        for text, x, y, font_size, is_italic in runs:
+            writer.append((x, y + font_size), text, font=fonts[is_italic], fontsize=font_size)
+
+    def layout_rich_text(
+        self,
         text: str,
         x: float,
         y: float,
         font_size: float = 22,
         max_width: Optional[float] = None,
         line_height: float = 1.4,
-    ) -> float:
+    ) -> Tuple[list[Tuple[str, float, float, float, bool]], float]:
+        """Place ``|italic|`` rich text word by word, wrapping at ``max_width``.
+
+        Returns the word runs for ``draw_text_lines`` and the height of the block.
+        """
         if max_width is None:
             max_width = self.layout.content_width - 60
 
-        parts = text.split("|")
-        words_with_style = []
-
-        for i, part in enumerate(parts):
-            is_italic = (i % 2 == 1)
-            for word in part.split():
-                words_with_style.append((word, is_italic))
+        words_with_style = _parse_rich_text(text)
 
         current_x = x
         current_y = y
         space_width = self.get_text_width(" ", font_size)
+        runs = []
 
         for word, is_italic in words_with_style:
             word_width = self.get_text_width(word, font_size, italic=is_italic)
@@ -145,10 +289,86 @@ class Renderer:
                 current_x = x
                 current_y += font_size * line_height
 
-            self.add_text(page, word, current_x, current_y, font_size, self.theme.black, italic=is_italic)
+            runs.append((word, current_x, current_y, font_size, is_italic))
             current_x += word_width + space_width
 
-        return current_y - y + font_size * line_height
+        return runs, current_y - y + font_size * line_height
+
+    def draw_rich_text(
+        self,
+        page: fitz.Page,
+        text: str,
+        x: float,
+        y: float,
+        font_size: float = 22,
+        max_width: Optional[float] = None,
+        line_height: float = 1.4,
+    ) -> float:
+        runs, height = self.layout_rich_text(text, x, y, font_size, max_width, line_height)
+        self.draw_text_lines(page, runs)
+        return height
+
+    def stamp_form(
+        self,
+        page: fitz.Page,
+        key: Hashable,
+        draw: Callable[[fitz.Shape], None],
+        offset: Tuple[float, float] = (0.0, 0.0),
+    ) -> None:
+        """Paint a Form XObject shared by every page stamped with the same ``key``.
+
+        The first time a key is seen, ``draw`` adds and finishes the form's paths
+        on a fresh shape; later pages reference that one stream with a single
+        ``Do`` operator instead of repeating its drawing commands. ``offset``
+        moves the form by (dx, dy) page units, so one form can be placed anywhere.
+
+        A form's /BBox is its first page's size, so forms are cached per key and
+        page size. The form is registered in the page's /Resources; when that
+        dictionary is indirect it is shared with other pages, which then list the
+        form as well without painting it.
+        """
+        width, height = page.rect.width, page.rect.height
+        form_key = (key, width, height)
+        form = self._forms.get(form_key)
+        if form is None:
+            shape = page.new_shape()
+            draw(shape)
+            xref = self.doc.get_new_xref()
+            self.doc.update_object(xref, f"<</Type/XObject/Subtype/Form/BBox[0 0 {width:g} {height:g}]>>")
+            self.doc.update_stream(xref, shape.totalcont.encode())
+            form = self._forms[form_key] = (f"Form{len(self._forms)}", xref)
+        name, xref = form
+
+        resources = self.doc.xref_get_key(page.xref, "Resources")
+        if resources[0] == "xref":
+            self.doc.xref_set_key(int(resources[1].split()[0]), f"XObject/{name}", f"{xref} 0 R")
+        else:
+            self.doc.xref_set_key(page.xref, f"Resources/XObject/{name}", f"{xref} 0 R")
+        # wrap_contents rescans the whole page content; everything written to
+        # our pages afterwards is balanced, so once per page is enough
+        if page.xref not in self._wrapped_pages:
+            page.wrap_contents()
+            self._wrapped_pages.add(page.xref)
+
+        dx, dy = offset
+        if dx or dy:
+            # Page y grows downward, PDF y upward
+            placement = f"1 0 0 1 {_pdf_number(dx)} {_pdf_number(-dy)} cm "
+        else:
+            placement = ""
+        content_xref = self.doc.get_new_xref()
+        self.doc.update_object(content_xref, "<<>>")
+        self.doc.update_stream(content_xref, f"q {placement}/{name} Do Q".encode())
+
+        # Append the new stream to the end of the page's /Contents
+        kind, contents = self.doc.xref_get_key(page.xref, "Contents")
+        if kind == "array":
+            contents = f"{contents[:-1]} {content_xref} 0 R]"
+        elif kind == "xref":
+            contents = f"[{contents} {content_xref} 0 R]"
+        else:
+            contents = f"{content_xref} 0 R"
+        self.doc.xref_set_key(page.xref, "Contents", contents)
 
     def draw_dot_grid(self, page: fitz.Page, start_y: float | None = None, end_y: float | None = None) -> None:
         if start_y is None:
@@ -156,29 +376,50 @@ class Renderer:
         if end_y is None:
             end_y = self.layout.content_bottom - 130
 
-        shape = page.new_shape()
-
+        # Pages with the same grid extent share one painted grid
+        self.stamp_form(page, ("dot_grid", start_y, end_y), lambda shape: self._draw_dot_grid_paths(shape, start_y, end_y))
+
+    def _draw_dot_grid_paths(self, shape: fitz.Shape, start_y: float, end_y: float) -> None:
+        _check_raw_path_target(shape)
+        layout = self.layout
+        dot_size = layout.dot_size
+        height = shape.height
+
+        # Every row shares the same column positions, so they are formatted
+        # once and each dot is written as a raw "re" operator
+        columns = []
+        x = layout.content_left
+        while x < layout.content_right:
+            columns.append(_pdf_number(x))
+            x += layout.dot_spacing
+        size = _pdf_number(dot_size)
+
+        rows = []
         y = start_y
         while y < end_y:
-            x = self.layout.content_left
-            while x < self.layout.content_right:
-                rect = fitz.Rect(x, y, x + self.layout.dot_size, y + self.layout.dot_size)
-                shape.draw_rect(rect)
-                x += self.layout.dot_spacing
-            y += self.layout.dot_spacing
+            row_tail = f" {_pdf_number(height - (y + dot_size))} {size} {size} re\n"
+            rows.append(row_tail.join(columns) + row_tail)
+            y += layout.dot_spacing
 
+        shape.draw_cont = "".join(rows)
         shape.finish(color=self.theme.black, fill=self.theme.black)
-        shape.commit()
 
-    def draw_lightning(self, page: fitz.Page, x: float, y: float, scale: float = 1.8, color=None) -> None:
+    def draw_lightning(
+        self, page: fitz.Page, x: float, y: float, scale: float = 1.8, color=None, shape: fitz.Shape | None = None
+    ) -> None:
+        """Draw the lightning icon; pass ``shape`` to batch it into a caller's shape, which the caller commits."""
         if color is None:
             color = self.theme.black
         points = [
             (8, 0), (15, 0), (9, 10), (16, 10),
             (0, 26), (5, 13), (0, 13), (8, 0)
         ]
-        scaled_points = [fitz.Point(x + p[0] * scale, y + p[1] * scale) for p in points]
-        page.draw_polyline(scaled_points, color=color, fill=color, closePath=True)
+        scaled_points = [(x + px * scale, y + py * scale) for px, py in points]
+        if shape is None:
+            page.draw_polyline(scaled_points, color=color, fill=color, closePath=True)
+            return
+        shape.draw_polyline(scaled_points)
+        shape.finish(color=color, fill=color, closePath=True)
 
     def draw_lightning_white(self, page: fitz.Page, x: float, y: float, scale: float = 1.8) -> None:
         points = [
@@ -187,7 +428,7 @@ class Renderer:
         ]
         scaled_points = [(x + px * scale, y + py * scale) for px, py in points]
         shape = page.new_shape()
-        shape.draw_polyline([fitz.Point(px, py) for px, py in scaled_points])
+        shape.draw_polyline(scaled_points)
         shape.finish(fill=self.theme.white, closePath=True)
         shape.commit()
 
@@ -208,30 +449,38 @@ class Renderer:
                 x + size * 0.38 * math.cos(inner_angle),
                 y + size * 0.38 * math.sin(inner_angle)
             ))
-        fitz_points = [fitz.Point(px, py) for px, py in points]
-        page.draw_polyline(fitz_points, color=color, fill=color, closePath=True)
+        page.draw_polyline(points, color=color, fill=color, closePath=True)
 
     def draw_lightbulb(self, page: fitz.Page, x: float, y: float, size: float = 12, color=None) -> None:
         """Draw a simple hand-drawn style lightbulb icon - clearer design."""
         if color is None:
             color = self.theme.black
         stroke = 2.0
+        shape = page.new_shape()
         # Main bulb - larger and more centered
         r = size * 0.5
         bulb_center_y = y - r * 0.3
-        page.draw_circle(fitz.Point(x, bulb_center_y), r, color=color, width=stroke)
+        shape.draw_circle((x, bulb_center_y), r)
+        shape.finish(color=color, width=stroke)
         # Neck/base - narrower and shorter
         neck_w = r * 0.5
         neck_top = bulb_center_y + r * 0.9
         neck_bot = bulb_center_y + r * 1.3
-        page.draw_line(fitz.Point(x - neck_w, neck_top), fitz.Point(x - neck_w * 0.7, neck_bot), color=color, width=stroke)
-        page.draw_line(fitz.Point(x + neck_w, neck_top), fitz.Point(x + neck_w * 0.7, neck_bot), color=color, width=stroke)
-        page.draw_line(fitz.Point(x - neck_w * 0.7, neck_bot), fitz.Point(x + neck_w * 0.7, neck_bot), color=color, width=stroke)
+        add_line_segments(shape, (
+            (x - neck_w, neck_top, x - neck_w * 0.7, neck_bot),
+            (x + neck_w, neck_top, x + neck_w * 0.7, neck_bot),
+            (x - neck_w * 0.7, neck_bot, x + neck_w * 0.7, neck_bot),
+        ))
+        shape.finish(color=color, width=stroke, closePath=False)
         # Filament lines inside bulb for clarity
         filament_y = bulb_center_y + r * 0.1
         filament_w = r * 0.35
-        page.draw_line(fitz.Point(x - filament_w, filament_y), fitz.Point(x, filament_y - r * 0.3), color=color, width=stroke * 0.7)
-        page.draw_line(fitz.Point(x, filament_y - r * 0.3), fitz.Point(x + filament_w, filament_y), color=color, width=stroke * 0.7)
+        add_line_segments(shape, (
+            (x - filament_w, filament_y, x, filament_y - r * 0.3),
+            (x, filament_y - r * 0.3, x + filament_w, filament_y),
+        ))
+        shape.finish(color=color, width=stroke * 0.7, closePath=False)
+        shape.commit()
 
     def draw_eye(self, page: fitz.Page, x: float, y: float, size: float = 12, color=None) -> None:
         """Draw a simple hand-drawn style eye icon."""
@@ -240,18 +489,41 @@ class Renderer:
         stroke = 1.8
         w = size * 0.9
         h = size * 0.45
-        page.draw_line(fitz.Point(x - w, y), fitz.Point(x - w * 0.3, y - h), color=color, width=stroke)
-        page.draw_line(fitz.Point(x - w * 0.3, y - h), fitz.Point(x + w * 0.3, y - h), color=color, width=stroke)
-        page.draw_line(fitz.Point(x + w * 0.3, y - h), fitz.Point(x + w, y), color=color, width=stroke)
-        page.draw_line(fitz.Point(x - w, y), fitz.Point(x - w * 0.3, y + h), color=color, width=stroke)
-        page.draw_line(fitz.Point(x - w * 0.3, y + h), fitz.Point(x + w * 0.3, y + h), color=color, width=stroke)
-        page.draw_line(fitz.Point(x + w * 0.3, y + h), fitz.Point(x + w, y), color=color, width=stroke)
+        shape = page.new_shape()
+        add_line_segments(shape, (
+            (x - w, y, x - w * 0.3, y - h),
+            (x - w * 0.3, y - h, x + w * 0.3, y - h),
+            (x + w * 0.3, y - h, x + w, y),
+            (x - w, y, x - w * 0.3, y + h),
+            (x - w * 0.3, y + h, x + w * 0.3, y + h),
+            (x + w * 0.3, y + h, x + w, y),
+        ))
+        shape.finish(color=color, width=stroke, closePath=False)
         pupil_r = size * 0.2
-        page.draw_circle(fitz.Point(x, y), pupil_r, color=color, fill=color)
+        shape.draw_circle((x, y), pupil_r)
+        shape.finish(color=color, fill=color)
+        shape.commit()
+
+    def _stamp_arrow(self, page: fitz.Page, draw: Callable[..., None], x: float, y: float, size: float, color) -> None:
+        # Standalone arrows differ only in position, so each size and color is
+        # drawn once into a form at a fixed anchor and moved into place
+        anchor = size * 2
+        self.stamp_form(
+            page,
+            (draw.__name__, size, color),
+            lambda shape: draw(page, anchor, anchor, size, color, shape=shape),
+            offset=(x - anchor, y - anchor),
+        )
 
-    def draw_arrow_right(self, page: fitz.Page, x: float, y: float, size: float, color=None) -> None:
+    def draw_arrow_right(
+        self, page: fitz.Page, x: float, y: float, size: float, color=None, shape: fitz.Shape | None = None
+    ) -> None:
+        """Draw a right arrow; pass ``shape`` to batch it into a caller's shape, which the caller commits."""
         if color is None:
             color = self.theme.black
+        if shape is None:
+            self._stamp_arrow(page, self.draw_arrow_right, x, y, size, color)
+            return
         shaft_length = size * 1.2
         head_size = size * 0.6
         stroke_width = size * 0.12
@@ -259,25 +531,20 @@ class Renderer:
         tip_x = x + shaft_length
         tip_y = y
 
-        page.draw_line(
-            fitz.Point(x, y),
-            fitz.Point(tip_x - head_size * 0.3, y),
-            color=color, width=stroke_width,
-        )
-        page.draw_line(
-            fitz.Point(tip_x, tip_y),
-            fitz.Point(tip_x - head_size, tip_y - head_size * 0.7),
-            color=color, width=stroke_width,
-        )
-        page.draw_line(
-            fitz.Point(tip_x, tip_y),
-            fitz.Point(tip_x - head_size, tip_y + head_size * 0.7),
-            color=color, width=stroke_width,
-        )
+        shape.draw_line((x, y), (tip_x - head_size * 0.3, y))
+        shape.draw_line((tip_x, tip_y), (tip_x - head_size, tip_y - head_size * 0.7))
+        shape.draw_line((tip_x, tip_y), (tip_x - head_size, tip_y + head_size * 0.7))
+        shape.finish(color=color, width=stroke_width, closePath=False)
 
-    def draw_arrow_left(self, page: fitz.Page, x: float, y: float, size: float, color=None) -> None:
+    def draw_arrow_left(
+        self, page: fitz.Page, x: float, y: float, size: float, color=None, shape: fitz.Shape | None = None
+    ) -> None:
+        """Draw a left arrow; pass ``shape`` to batch it into a caller's shape, which the caller commits."""
         if color is None:
             color = self.theme.black
+        if shape is None:
+            self._stamp_arrow(page, self.draw_arrow_left, x, y, size, color)
+            return
         shaft_length = size * 1.2
         head_size = size * 0.6
         stroke_width = size * 0.12
@@ -285,42 +552,29 @@ class Renderer:
         tip_x = x
         tip_y = y
 
-        page.draw_line(
-            fitz.Point(x + shaft_length, y),
-            fitz.Point(tip_x + head_size * 0.3, y),
-            color=color, width=stroke_width,
-        )
-        page.draw_line(
-            fitz.Point(tip_x, tip_y),
-            fitz.Point(tip_x + head_size, tip_y - head_size * 0.7),
-            color=color, width=stroke_width,
-        )
-        page.draw_line(
-            fitz.Point(tip_x, tip_y),
-            fitz.Point(tip_x + head_size, tip_y + head_size * 0.7),
-            color=color, width=stroke_width,
-        )
+        shape.draw_line((x + shaft_length, y), (tip_x + head_size * 0.3, y))
+        shape.draw_line((tip_x, tip_y), (tip_x + head_size, tip_y - head_size * 0.7))
+        shape.draw_line((tip_x, tip_y), (tip_x + head_size, tip_y + head_size * 0.7))
+        shape.finish(color=color, width=stroke_width, closePath=False)
 
     def draw_footer_section(self, page: fitz.Page, footer_text: str) -> None:
         """Draw a compact footer section with gray divider line and lightning icon."""
         # Compact layout - position from actual page bottom, not content_bottom
         # Footer needs ~45px: divider line + 8px gap + text/icon (~36px)
-        line_y = self.layout.target_height - 55
+        line_y = self.layout.footer_y
         text_y = line_y + 8
 
-        # Gray divider line
-        page.draw_line(
-            fitz.Point(self.layout.content_left, line_y),
-            fitz.Point(self.layout.content_right, line_y),
-            color=self.theme.gray,
-            width=0.5,
-        )
+        # Gray divider line and smaller lightning icon, identical on every
+        # footer, are stamped from one shared form
+        def draw_divider_and_icon(shape: fitz.Shape) -> None:
+            shape.draw_line((self.layout.content_left, line_y), (self.layout.content_right, line_y))
+            shape.finish(**self.rule_style)
+            self.draw_lightning(page, self.layout.content_left, text_y + 2, scale=1.4, shape=shape)
 
-        # Smaller lightning icon
-        self.draw_lightning(page, self.layout.content_left, text_y + 2, scale=1.4)
+        self.stamp_form(page, "footer", draw_divider_and_icon)
 
         # Footer text in black - strip rich text markers for simple rendering
-        plain_text = footer_text.replace("|", "")
+        plain_text = _strip_rich_markers(footer_text)
         self.add_text(
             page,
             plain_text,
@@ -343,7 +597,7 @@ class Renderer:
         if font_size is None:
             font_size = self.typography.sizes["nav"]
 
-        page = self.doc[page_idx]
+        page = self.page(page_idx)
         text_x = x
 
         if with_arrow:
@@ -3,11 +3,14 @@
 Generate Bullet Journal PDF optimized for reMarkable Paper Pro Move (rPPM).
 
 Usage:
-    python main.py          # Generate for current year
-    python main.py 2025     # Generate for specific year
+    python main.py                  # Generate for current year
+    python main.py 2025             # Generate for specific year
+    python main.py 2025 2026 2027   # Generate several years in parallel
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
@@ -16,25 +19,42 @@ from bujo import BulletJournalGenerator
 from bujo.config import Settings
 
 
-def main() -> None:
-    if len(sys.argv) > 1:
-        year = int(sys.argv[1])
-    else:
-        year = datetime.now().year
-
+def generate_year(year: int) -> tuple[str, list[str]]:
     output_path = f"output/BulletJournal_rPPM_{year}.pdf"
     settings = replace(Settings(), year=year, output_path=output_path)
     generator = BulletJournalGenerator(settings=settings, asset_root=Path("."))
     doc, report = generator.generate()
     generator.save(doc, output_path)
+    return output_path, report.summary_lines()
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        # A year named twice would have two workers writing the same file
+        years = list(dict.fromkeys(int(arg) for arg in sys.argv[1:]))
+    else:
+        years = [datetime.now().year]
+
+    # Each year is a separate document with its own links and shared page
+    # resources, so whole years are the unit handed to worker processes.
+    # PyMuPDF keeps global MuPDF state and does not support concurrent use from
+    # threads, even on separate documents or free-threaded builds, so the
+    # workers are processes rather than threads.
+    if len(years) == 1:
+        results = [generate_year(years[0])]
+    else:
+        # Builds are CPU-bound, so extra workers beyond the core count only contend
+        with ProcessPoolExecutor(max_workers=min(len(years), os.cpu_count() or 1)) as pool:
+            results = list(pool.map(generate_year, years))
 
     print("\n" + "=" * 50)
     print("GENERATION COMPLETE")
     print("=" * 50)
-    print(f"Output: {output_path}")
+    for output_path, summary_lines in results:
+        print(f"Output: {output_path}")
 
-    for line in report.summary_lines():
-        print(f"Validation: {line}")
+        for line in summary_lines:
+            print(f"Validation: {line}")
 
 
 if __name__ == "__main__":
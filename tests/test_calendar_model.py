@@ -0,0 +1,60 @@
+from datetime import date
+
+import pytest
+
+from bujo.calendar_model import CalendarModel
+
+
+@pytest.mark.parametrize(
+    ("year", "week2_label"),
+    [(1, "Jan 8 - Jan 14"), (9999, "Jan 11 - Jan 17")],
+)
+def test_for_year_at_date_limits(year, week2_label):
+    model = CalendarModel.for_year(year)
+
+    assert model.total_days == 365
+    assert model.week_date_range(1)[0].year == year
+    assert model.week_date_range_label(2) == week2_label
+
+
+def test_boundary_weeks_outside_date_range_raise_on_lookup():
+    first = CalendarModel.for_year(1)
+    last = CalendarModel.for_year(9999)
+
+    assert first.week_date_range(first.weeks_in_year + 1) == (date(1, 12, 31), date(2, 1, 6))
+    assert last.week_date_range(0) == (date(9998, 12, 28), date(9999, 1, 3))
+    with pytest.raises(ValueError):
+        first.week_date_range(0)
+    with pytest.raises(ValueError):
+        last.week_date_range_label(last.weeks_in_year + 1)
+
+
+def test_week_groupings_are_fresh_lists():
+    model = CalendarModel.for_year(2026)
+
+    week_starts = model.compute_week_starts()
+    weeks_by_month = model.compute_weeks_by_month()
+    assert isinstance(week_starts, list)
+    assert all(isinstance(weeks, list) for weeks in weeks_by_month)
+
+    week_starts.append(99)
+    weeks_by_month[0].append(99)
+    assert 99 not in model.compute_week_starts()
+    assert 99 not in model.compute_weeks_by_month()[0]
+
+
+def test_iso_weeks_match_isocalendar_1900_to_2100():
+    for year in range(1900, 2101):
+        model = CalendarModel.for_year(year)
+        for month in model.months:
+            for day in range(1, month.days + 1):
+                assert model.week_of_date(month.index, day) == date(year, month.index + 1, day).isocalendar().week
+
+
+def test_cached_model_months_cannot_be_mutated():
+    model = CalendarModel.for_year(2026)
+
+    with pytest.raises(TypeError):
+        model.months[0] = model.months[1]
+    assert CalendarModel.for_year(2026) is model
+    assert model.months[0].name == "January"
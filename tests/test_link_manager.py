@@ -0,0 +1,28 @@
+import fitz
+
+from bujo.link_manager import LinkManager
+
+
+def test_apply_appends_links_after_existing_annotations():
+    doc = fitz.open()
+    for _ in range(3):
+        doc.new_page(width=300, height=400)
+    doc[0].insert_link({"kind": fitz.LINK_GOTO, "page": 2, "from": fitz.Rect(0, 0, 10, 10)})
+
+    links = LinkManager()
+    links.add(0, (20, 30, 40, 50), 1)
+    links.add(1, (5, 6, 7, 8), 2)
+    links.add(1, (5, 6, 7, 8), 3)
+    invalid = links.apply(doc)
+
+    assert [(link.page_idx, link.dest_page_idx) for link in invalid] == [(1, 3)]
+    doc = fitz.open("pdf", doc.tobytes())
+    first = doc[0].get_links()
+    assert [(link["from"], link["page"]) for link in first] == [
+        (fitz.Rect(0, 0, 10, 10), 2),
+        (fitz.Rect(20, 30, 40, 50), 1),
+    ]
+    assert first[0]["id"] != first[1]["id"]
+    assert [(link["from"], link["page"], link["to"]) for link in doc[1].get_links()] == [
+        (fitz.Rect(5, 6, 7, 8), 2, fitz.Point(0, 0)),
+    ]
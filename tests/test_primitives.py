@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import fitz
+import pytest
+
+from bujo.config import Layout, Theme, Typography
+from bujo.link_manager import LinkManager
+from bujo.render.primitives import FontManager, Renderer, add_line_segments
+
+
+def _renderer(doc):
+    typography = Typography()
+    return Renderer(doc, Layout(), Theme(), typography, FontManager(typography, Path(".")), LinkManager())
+
+
+def _draw_square(page, rect, color):
+    shape = page.new_shape()
+    shape.draw_rect(rect)
+    shape.finish(color=color, fill=color)
+    shape.commit()
+
+
+def test_add_line_segments_matches_draw_line():
+    page = fitz.open().new_page(width=200, height=300)
+    shape = page.new_shape()
+    add_line_segments(shape, [(10, 20, 110, 20), (10, 40, 10.5, 250)])
+    expected = page.new_shape()
+    expected.draw_line((10, 20), (110, 20))
+    expected.draw_line((10, 40), (10.5, 250))
+
+    assert shape.draw_cont.split() == expected.draw_cont.split()
+
+
+def test_add_line_segments_rejects_rotated_page():
+    page = fitz.open().new_page(width=200, height=300)
+    page.set_rotation(90)
+    shape = page.new_shape()
+
+    with pytest.raises(ValueError, match="unrotated"):
+        add_line_segments(shape, [(10, 20, 110, 20)])
+    assert shape.draw_cont == ""
+
+
+def test_stamp_form_shares_one_form_per_key_and_page_size():
+    doc = fitz.open()
+    doc.new_page(width=200, height=300)
+    doc.new_page(width=200, height=300)
+    doc.new_page(width=400, height=300)
+    renderer = _renderer(doc)
+
+    def draw(shape):
+        shape.draw_rect(fitz.Rect(10, 10, 30, 30))
+        shape.finish(color=(0, 0, 0), fill=(0, 0, 0))
+
+    _draw_square(doc[0], fitz.Rect(50, 50, 70, 70), (1, 0, 0))
+    renderer.stamp_form(doc[0], "square", draw)
+    _draw_square(doc[0], fitz.Rect(100, 100, 120, 120), (0, 0, 1))
+    renderer.stamp_form(doc[1], "square", draw, offset=(40, 60))
+    renderer.stamp_form(doc[2], "square", draw)
+
+    doc = fitz.open("pdf", doc.tobytes())
+    forms = [{xref for xref, *_ in page.get_xobjects()} for page in doc]
+    assert forms[0] == forms[1]
+    assert len(forms[0]) == 1
+    assert forms[2].isdisjoint(forms[0])
+
+    first, second = doc[0].get_pixmap(), doc[1].get_pixmap()
+    assert first.pixel(20, 20) == (0, 0, 0)
+    assert first.pixel(60, 60) == (255, 0, 0)
+    assert first.pixel(110, 110) == (0, 0, 255)
+    assert second.pixel(60, 80) == (0, 0, 0)
+    assert second.pixel(20, 20) == (255, 255, 255)
@@ -0,0 +1,11 @@
+from dataclasses import replace
+
+import pytest
+
+from bujo.config import Settings
+
+
+@pytest.mark.parametrize("pages_per_day", [0, -1])
+def test_pages_per_day_must_be_positive(pages_per_day):
+    with pytest.raises(ValueError, match="pages_per_day"):
+        replace(Settings(), pages_per_day=pages_per_day)